@@ -6,6 +6,7 @@ All agents use the Strands Agents SDK.
 """
 
 from .researcher import get_researcher, get_researcher_tool
+from .researcher_registry import get_shared_researcher_tool
 from .trader import Trader
 from .trading_floor import (
     create_traders,
@@ -17,6 +18,7 @@ __all__ = [
     "Trader",
     "get_researcher",
     "get_researcher_tool",
+    "get_shared_researcher_tool",
     "create_traders",
     "run_every_n_minutes",
     "run_once",
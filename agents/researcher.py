@@ -13,18 +13,26 @@ Key Features:
 """
 
 import asyncio
-from contextlib import AsyncExitStack
-from typing import Optional
-from mcp.client.stdio import StdioServerParameters, stdio_client
-from strands import Agent
-from strands.tools.mcp import MCPClient
+import os
+import traceback
+from typing import TYPE_CHECKING
+
 from core.model_providers import ModelProvider
 from core.templates import researcher_instructions, research_tool
-from infrastructure.mcp_params import researcher_mcp_server_params
 from core.observability import create_log_hook
+from core.tool_cache import research_cache, research_query_index
+
+# The strands and mcp stacks are imported on first factory call, not at
+# module import, keeping cold starts (CLI/tests) off their import cost
+if TYPE_CHECKING:
+    from strands import Agent
+
+# Ceiling on a single research run; a wedged search/fetch upstream should
+# cost the trader this much at worst, not the whole cycle
+RESEARCH_TIMEOUT_SECONDS = float(os.getenv("RESEARCH_TIMEOUT_SECONDS", "300"))
 
 
-async def get_researcher(trader_name: str, model_name: str = "gpt-4o-mini") -> Agent:
+async def get_researcher(trader_name: str, model_name: str = "gpt-4o-mini") -> "Agent":
     """
     Create a Researcher agent using Strands SDK.
     
@@ -44,25 +52,11 @@ async def get_researcher(trader_name: str, model_name: str = "gpt-4o-mini") -> A
         The MCP servers must be configured in infrastructure/mcp_params.py
         The agent uses system_prompt (not instructions) in Strands API
     """
-    
-    mcp_server_params = researcher_mcp_server_params(trader_name)   
-    mcp_tools = []
-    for params in mcp_server_params:
-        server_params = StdioServerParameters(
-            command=params["command"],
-            args=params["args"],
-            env=params.get("env")
-        )
-        
-        def make_transport(sp=server_params):
-            return stdio_client(sp)
-        
-        mcp_client = MCPClient(
-            transport_callable=make_transport,
-            startup_timeout=120
-        )
-        mcp_tools.append(mcp_client)
-    
+    from strands import Agent
+    from infrastructure.mcp_pool import get_pooled_researcher_clients
+
+    mcp_tools = await get_pooled_researcher_clients(trader_name)
+
     model = ModelProvider.get_strands_model(model_name)
     log_hook = create_log_hook(trader_name)
     
@@ -102,9 +96,15 @@ async def get_researcher_tool(trader_name: str, model_name: str = "gpt-4o-mini")
         # Trader can now call the researcher tool
     """
     from strands import tool
-    
+
     researcher = await get_researcher(trader_name, model_name)
-    
+
+    # The wrapped researcher is one Agent instance with shared message
+    # history, which is not safe under concurrent invocation (the trader's
+    # concurrent tool executor can call this tool twice in one turn), so
+    # invocations serialize on this lock
+    invoke_lock = asyncio.Lock()
+
     @tool(
         name="Researcher",
         description=research_tool()
@@ -123,23 +123,45 @@ async def get_researcher_tool(trader_name: str, model_name: str = "gpt-4o-mini")
         Returns:
             Research findings and analysis
         """
-        result = await researcher.invoke_async(query)
-        
+        # Overlapping (and near-duplicate) queries from the traders within
+        # a cycle share results
+        args_key = (model_name, await research_query_index.resolve(query))
+        cached = research_cache.get("Researcher", args_key)
+        if cached is not None:
+            return cached
+
+        async with invoke_lock:
+            # A duplicate query that queued behind us may already be
+            # answered; re-check before paying for another run
+            cached = research_cache.get("Researcher", args_key)
+            if cached is not None:
+                return cached
+
+            try:
+                result = await asyncio.wait_for(
+                    researcher.invoke_async(query), RESEARCH_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # Not cached: the next query should get a real attempt
+                return (
+                    f"Research timed out after {RESEARCH_TIMEOUT_SECONDS:.0f}s. "
+                    "Proceed with the information you already have."
+                )
+
+        # Happy path first: the known response shape is a dict with a list
+        # of dict content blocks, so reach straight for it and fall back
+        # only when the shape differs
         try:
-            if hasattr(result, 'message'):
-                msg = result.message
-                if isinstance(msg, dict) and 'content' in msg:
-                    content = msg['content']
-                    if isinstance(content, list) and len(content) > 0:
-                        first_content = content[0]
-                        if isinstance(first_content, dict) and 'text' in first_content:
-                            return first_content['text']
-                        elif hasattr(first_content, 'text'):
-                            return first_content.text
-            
-            return str(result.message)
-        except Exception as e:
-            return f"Error extracting response: {e}\nRaw result: {result.message}"
+            text = result.message["content"][0]["text"]
+        except (AttributeError, KeyError, TypeError, IndexError):
+            message = getattr(result, 'message', None)
+            try:
+                text = message["content"][0].text
+            except (AttributeError, KeyError, TypeError, IndexError):
+                text = str(message)
+
+        research_cache.put("Researcher", args_key, text)
+        return text
     
     return researcher_tool
 
@@ -177,8 +199,8 @@ async def test_researcher_standalone(trader_name: str = "Warren", model_name: st
         return True
     except Exception as e:
         print(f"✗ Researcher invocation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.getenv("STRANDS_DEBUG"):
+            traceback.print_exc()
         return False
     finally:
         if hasattr(researcher, 'cleanup') and callable(researcher.cleanup):
@@ -198,7 +220,6 @@ if __name__ == "__main__":
             sys.exit(1)
         except Exception as e:
             print(f"\n\nUnexpected error: {e}")
-            import traceback
             traceback.print_exc()
             sys.exit(1)
     
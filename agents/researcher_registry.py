@@ -0,0 +1,91 @@
+"""
+Researcher Tool Registry
+
+Process-wide cache of researcher tools keyed by (trader_name, model_name).
+
+Previously every Trader.run_with_mcp_servers call built a fresh researcher
+agent, so each trading cycle re-created the researcher and its tool wrapper
+even though nothing about it changes between cycles. The registry builds
+each researcher tool once and hands the same instance back on subsequent
+cycles; the underlying MCP clients are already shared via the
+infrastructure MCP pool.
+
+Entries are refcounted: each get_shared_researcher_tool call takes a
+reference and release_researcher_tool drops one, evicting the entry when
+the count reaches zero. Concurrent traders on the same key therefore keep
+one tool alive between them, and it is only rebuilt once the last user is
+done with it (the pooled MCP subprocesses stay up regardless — teardown
+here only drops the agent/tool wrapper).
+
+The cache is keyed per trader (not just per model) because the researcher's
+knowledge-graph memory is isolated per trader name, so traders sharing a
+model still get their own researcher.
+"""
+
+import asyncio
+
+from agents.researcher import get_researcher_tool
+
+# Maps key -> Task resolving to the tool; storing tasks (the same pattern
+# as MCPClientPool.connect) means the lock is only held to register the
+# build, so different traders' first-cycle researcher setups — including
+# their per-trader memory-server connects — run concurrently
+_cache: dict = {}
+_refcounts: dict = {}
+_lock = asyncio.Lock()
+
+
+async def get_shared_researcher_tool(trader_name: str, model_name: str = "gpt-4o-mini"):
+    """
+    Get the cached researcher tool for a trader, creating it on first use.
+
+    Takes a reference; pair each call with release_researcher_tool.
+
+    Args:
+        trader_name: Name of the trader (for memory isolation)
+        model_name: Model to use
+
+    Returns:
+        Tool-wrapped Researcher agent, shared across this trader's cycles
+    """
+    key = (trader_name, model_name)
+    async with _lock:
+        task = _cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(get_researcher_tool(trader_name, model_name))
+            _cache[key] = task
+        _refcounts[key] = _refcounts.get(key, 0) + 1
+    try:
+        return await task
+    except BaseException:
+        # A failed build shouldn't stay cached (the next acquisition
+        # should retry) or leak the reference just taken
+        await release_researcher_tool(trader_name, model_name)
+        raise
+
+
+async def release_researcher_tool(trader_name: str, model_name: str = "gpt-4o-mini"):
+    """
+    Drop one reference to a trader's researcher tool.
+
+    The cached entry is evicted when the last reference is released, so
+    the next acquisition rebuilds it; unbalanced releases are ignored.
+
+    Args:
+        trader_name: Name of the trader
+        model_name: Model the tool was acquired with
+    """
+    key = (trader_name, model_name)
+    async with _lock:
+        count = _refcounts.get(key, 0)
+        if count <= 1:
+            _refcounts.pop(key, None)
+            _cache.pop(key, None)
+        else:
+            _refcounts[key] = count - 1
+
+
+def clear_researcher_tools():
+    """Drop all cached researcher tools (next use rebuilds them)."""
+    _cache.clear()
+    _refcounts.clear()
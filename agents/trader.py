@@ -17,24 +17,89 @@ Key Features:
 """
 
 import asyncio
-import json
-from contextlib import AsyncExitStack
+import orjson
+import os
+import re
+import time
 from typing import Optional
-from mcp.client.stdio import StdioServerParameters, stdio_client
 
 from strands import Agent
-from strands.tools.mcp import MCPClient
+
+try:
+    # Runs independent tool calls from one assistant turn concurrently;
+    # older SDK versions without it fall back to the sequential default
+    from strands.tools.executors import ConcurrentToolExecutor
+except ImportError:
+    ConcurrentToolExecutor = None
+
 from core.model_providers import ModelProvider
 from core.templates import trader_instructions, trade_message, rebalance_message
-from infrastructure.mcp_params import trader_mcp_server_params
-from agents.researcher import get_researcher_tool
+from infrastructure.mcp_pool import get_pooled_clients, reconnect_pooled_clients
+from agents.researcher_registry import (
+    get_shared_researcher_tool,
+    release_researcher_tool,
+)
 from infrastructure.accounts_client import read_accounts_resource, read_strategy_resource
-from infrastructure.database import write_log
+from infrastructure.database import write_log, read_plan, write_plan
 from core.observability import create_log_hook
 
 
+# Enforced per invocation via the log hook: the run aborts with
+# TurnLimitExceeded once the model has been called this many times
 MAX_TURNS = 30
 
+# Hard wall-clock deadline on one agent invocation. Generous by default
+# because a single research call can legitimately run for minutes
+INVOKE_TIMEOUT_SECONDS = float(os.getenv("TRADER_INVOKE_TIMEOUT_SECONDS", "600"))
+
+# Retries around agent invocation when an MCP stdio transport drops
+MAX_INVOKE_ATTEMPTS = 3
+_TRANSPORT_ERRORS = (BrokenPipeError, ConnectionError, asyncio.TimeoutError)
+
+# Matches the time-series key and its list-of-pairs value (one level of
+# nested lists), plus the trailing comma when the key isn't last
+_PV_SERIES_RE = re.compile(
+    r'"portfolio_value_time_series"\s*:\s*\[(?:[^\[\]]|\[[^\[\]]*\])*\]\s*,?'
+)
+_TRAILING_COMMA_RE = re.compile(r',(\s*})')
+
+
+def strip_time_series(account: str) -> str:
+    """
+    Remove the portfolio_value_time_series entry from an account JSON string.
+
+    The trader itself now asks the accounts server for the brief report
+    (see get_account_report), but this helper remains for payloads that
+    were fetched in full. The series dominates such payloads once an
+    account has been through many cycles, so strip it at the string level
+    instead of parsing the whole document just to drop one key. The
+    substitution is validated by re-parsing its output: anything the regex
+    mishandles (no match, or a partial match when a series string contains
+    an unbalanced bracket) falls back to a full orjson round trip.
+
+    Args:
+        account: Account JSON string as returned by the accounts server
+
+    Returns:
+        Account JSON string without the time series
+    """
+    stripped, count = _PV_SERIES_RE.subn('', account, count=1)
+    if count:
+        # Removing a final key can leave a dangling comma before the brace
+        stripped = _TRAILING_COMMA_RE.sub(r'\1', stripped)
+        try:
+            orjson.loads(stripped)
+        except orjson.JSONDecodeError:
+            # A bracket inside a series string can end the match early,
+            # leaving the tail of the series behind; use the safe path
+            pass
+        else:
+            return stripped
+
+    account_json = orjson.loads(account)
+    account_json.pop("portfolio_value_time_series", None)
+    return orjson.dumps(account_json).decode()
+
 
 class Trader:
     """
@@ -58,6 +123,15 @@ class Trader:
         self.model_name = model_name
         self.agent = None
         self.do_trade = True
+        # The system prompt is invariant for a given trader, so render it once
+        self._system_prompt = trader_instructions(name)
+        # Identities of the tools the current agent was built with; the agent
+        # is rebuilt only when the pooled clients change (e.g. a reconnect)
+        self._agent_tool_ids: Optional[tuple] = None
+        self._log_hook = None
+        # Refcounted handle from the researcher registry, acquired on first
+        # run and held until close()
+        self._researcher_tool = None
     
     async def create_agent(self, trader_mcp_servers, researcher_tool) -> Agent:
         """
@@ -72,18 +146,26 @@ class Trader:
         """
         model = ModelProvider.get_strands_model(self.model_name)
         
-        log_hook = create_log_hook(self.name)
-        
+        log_hook = create_log_hook(self.name, max_turns=MAX_TURNS)
+        self._log_hook = log_hook
+
         all_tools = [researcher_tool] + (trader_mcp_servers if trader_mcp_servers else [])
-        
-        self.agent = Agent(
+
+        agent_kwargs = dict(
             name=self.name,
-            system_prompt=trader_instructions(self.name),
+            system_prompt=self._system_prompt,
             model=model,
             tools=all_tools,
             hooks=[log_hook]
         )
-        
+        if ConcurrentToolExecutor is not None:
+            # A turn like "price of AAPL, MSFT and my account" becomes
+            # max(tool latencies) instead of their sum; the SDK keeps the
+            # results in call order for the next model turn
+            agent_kwargs["tool_executor"] = ConcurrentToolExecutor()
+
+        self.agent = Agent(**agent_kwargs)
+
         return self.agent
     
     async def get_account_report(self) -> str:
@@ -93,11 +175,35 @@ class Trader:
         Returns:
             JSON string with account details (without time series data)
         """
-        account = await read_accounts_resource(self.name)
-        account_json = json.loads(account)
-        account_json.pop("portfolio_value_time_series", None)
-        return json.dumps(account_json)
+        # Server-side projection: the series never leaves the accounts server
+        return await read_accounts_resource(self.name, include_time_series=False)
     
+    async def _invoke(self, message):
+        """
+        Drive one agent invocation, streaming when the SDK supports it.
+
+        stream_async surfaces tool and model events as they happen — the
+        log hook records them in real time instead of after the terminal
+        turn — and the final event carries the same AgentResult that
+        invoke_async returns. Falls back to invoke_async on SDKs without
+        streaming.
+
+        Args:
+            message: The task message for the agent
+
+        Returns:
+            The AgentResult for the completed invocation
+        """
+        stream = getattr(self.agent, "stream_async", None)
+        if stream is None:
+            return await self.agent.invoke_async(message)
+
+        result = None
+        async for event in stream(message):
+            if isinstance(event, dict) and "result" in event:
+                result = event["result"]
+        return result
+
     async def run_agent(self, trader_mcp_servers, researcher_tool):
         """
         Run the trader agent with a specific task (trade or rebalance).
@@ -106,55 +212,128 @@ class Trader:
             trader_mcp_servers: MCP servers for trader tools
             researcher_tool: Researcher agent as tool
         """
-        self.agent = await self.create_agent(trader_mcp_servers, researcher_tool)
-        
-        account = await self.get_account_report()
-        strategy = await read_strategy_resource(self.name)
-        
+        # Keep the agent instance alive for the life of the process — the
+        # model and tool wiring are the expensive parts — and rebuild only
+        # when the pooled client identities change (pool reconnect). The
+        # conversation history is reset per cycle below, since a Strands
+        # agent accumulates messages across invocations.
+        tool_ids = tuple(
+            id(tool) for tool in [researcher_tool] + (trader_mcp_servers or [])
+        )
+
+        # The resource reads hit the accounts MCP server and don't depend on
+        # the agent, so run them concurrently with (re)building it when a
+        # rebuild is due — wall-clock is the max of the three, not the sum
+        if self.agent is None or self._agent_tool_ids != tool_ids:
+            _, account, strategy = await asyncio.gather(
+                self.create_agent(trader_mcp_servers, researcher_tool),
+                self.get_account_report(),
+                read_strategy_resource(self.name)
+            )
+            self._agent_tool_ids = tool_ids
+        else:
+            account, strategy = await asyncio.gather(
+                self.get_account_report(),
+                read_strategy_resource(self.name)
+            )
+            # A reused agent still carries last cycle's conversation; start
+            # each cycle from the system prompt alone so context (and token
+            # cost) doesn't grow cycle over cycle and trade/rebalance turns
+            # don't bleed into each other
+            self.agent.messages = []
+
         message = (
             trade_message(self.name, strategy, account)
             if self.do_trade
             else rebalance_message(self.name, strategy, account)
         )
-        
-        result = await self.agent.invoke_async(message)
-        
-        mode = "trading" if self.do_trade else "rebalancing"
-        write_log(self.name, "agent", f"Completed {mode} - stop reason: {result.stop_reason}")
-        
+
+        # Reuse the tool plan that worked for this strategy/mode last time,
+        # so the model spends its turns on arguments rather than re-planning
+        mode = "trade" if self.do_trade else "rebalance"
+        # sqlite round trip: off-loop like the rest of the DB access
+        plan = await asyncio.to_thread(read_plan, self.lastname, mode)
+        if plan:
+            message += (
+                "\nThis sequence of tool calls worked well for this task last time; "
+                "follow it unless circumstances have changed, re-deciding only the "
+                f"specific stocks and amounts:\n{plan}\n"
+            )
+
+        # A dead MCP subprocess shouldn't cost the whole cycle: on a
+        # transport error, back off, rebuild the pooled clients and retry
+        for attempt in range(MAX_INVOKE_ATTEMPTS):
+            started = time.monotonic()
+            try:
+                result = await asyncio.wait_for(
+                    self._invoke(message), INVOKE_TIMEOUT_SECONDS
+                )
+                break
+            except _TRANSPORT_ERRORS as e:
+                # wait_for's deadline also surfaces as TimeoutError, but a
+                # stuck ReAct loop won't improve on retry — only transport
+                # drops (which fail well before the deadline) are retried
+                if (
+                    isinstance(e, asyncio.TimeoutError)
+                    and time.monotonic() - started >= INVOKE_TIMEOUT_SECONDS
+                ):
+                    write_log(
+                        self.name, "agent",
+                        f"Invocation exceeded {INVOKE_TIMEOUT_SECONDS:.0f}s deadline"
+                    )
+                    raise
+                if attempt == MAX_INVOKE_ATTEMPTS - 1:
+                    raise
+                write_log(
+                    self.name, "agent",
+                    f"Transport error ({e}), reconnecting MCP servers "
+                    f"(attempt {attempt + 1}/{MAX_INVOKE_ATTEMPTS})"
+                )
+                await asyncio.sleep(2 ** attempt)
+                trader_mcp_servers = await reconnect_pooled_clients()
+                self.agent = await self.create_agent(trader_mcp_servers, researcher_tool)
+                self._agent_tool_ids = tuple(
+                    id(tool) for tool in [researcher_tool] + trader_mcp_servers
+                )
+
+        # Store the tool sequence as the next plan template only for clean
+        # completions; a truncated or errored run is not a plan worth reusing
+        tool_sequence = getattr(self._log_hook, "tool_sequence", None)
+        if tool_sequence and getattr(result, "stop_reason", None) == "end_turn":
+            await asyncio.to_thread(write_plan, self.lastname, mode, "\n".join(
+                f"{i}. {tool_name}" for i, tool_name in enumerate(tool_sequence, 1)
+            ))
+
+        write_log(
+            self.name, "agent",
+            f"Completed {'trading' if self.do_trade else 'rebalancing'} "
+            f"- stop reason: {result.stop_reason}"
+        )
+
         return result
     
     async def run_with_mcp_servers(self):
         """
         Set up MCP servers and run the agent.
         
-        This method manages the lifecycle of:
+        This method uses the process-wide MCP client pool, so the
+        underlying stdio subprocesses are spawned once and reused
+        across traders and cycles:
         - Trader MCP servers (accounts, market, push)
-        - Researcher tool (which has its own MCP servers)
-        """
-        trader_mcp_tools = []
-        for params in trader_mcp_server_params:
-            server_params = StdioServerParameters(
-                command=params["command"],
-                args=params["args"],
-                env=params.get("env")
-            )
-            
-            def make_transport(sp=server_params):
-                return stdio_client(sp)
-            
-            mcp_client = MCPClient(
-                transport_callable=make_transport,
-                startup_timeout=120
+        - Researcher tool (which has its own pooled MCP servers)
+        """
+        if self._researcher_tool is None:
+            # The researcher tool setup is independent of the trader MCP
+            # clients, so fetch both concurrently. The registry reference is
+            # held for the life of this trader (see close())
+            trader_mcp_tools, self._researcher_tool = await asyncio.gather(
+                get_pooled_clients(),
+                get_shared_researcher_tool(self.name, self.model_name)
             )
-            trader_mcp_tools.append(mcp_client)
-        
-        researcher_tool = await get_researcher_tool(
-            self.name,
-            self.model_name
-        )
-        
-        await self.run_agent(trader_mcp_tools, researcher_tool)
+        else:
+            trader_mcp_tools = await get_pooled_clients()
+
+        await self.run_agent(trader_mcp_tools, self._researcher_tool)
     
     async def run_with_trace(self):
         """
@@ -188,6 +367,45 @@ class Trader:
         # Toggle mode for next run
         self.do_trade = not self.do_trade
 
+    async def close(self):
+        """
+        Release this trader's hold on its shared researcher tool.
+
+        Call when retiring a trader; the registry evicts the tool once
+        the last trader using the same (name, model) key has released it.
+        """
+        if self._researcher_tool is not None:
+            self._researcher_tool = None
+            await release_researcher_tool(self.name, self.model_name)
+
+    @classmethod
+    async def run_batch(cls, traders: list["Trader"], max_concurrency: int = 8) -> list:
+        """
+        Run many traders concurrently, bounded by a semaphore.
+
+        Wall-clock becomes roughly the slowest trader instead of the sum,
+        while max_concurrency keeps a large fleet from stampeding the
+        provider rate limits.
+
+        Args:
+            traders: Traders to run
+            max_concurrency: Maximum number of traders running at once
+
+        Returns:
+            Per-trader results in input order; exceptions are returned,
+            not raised, mirroring gather(return_exceptions=True)
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(trader: "Trader"):
+            async with sem:
+                return await trader.run()
+
+        return list(await asyncio.gather(
+            *[_one(trader) for trader in traders],
+            return_exceptions=True
+        ))
+
 
 async def test_single_trader(
     name: str = "Warren",
@@ -14,14 +14,15 @@ Key Features:
 """
 
 from agents.trader import Trader
+from core.model_providers import ModelProvider
 from typing import List
 import asyncio
 from infrastructure.market import is_market_open
-from dotenv import load_dotenv
+from infrastructure.mcp_pool import pool
+from core.tool_cache import begin_cycle
+from datetime import datetime
 import os
 
-load_dotenv(override=True)
-
 RUN_EVERY_N_MINUTES = int(os.getenv("RUN_EVERY_N_MINUTES", "60"))
 RUN_EVEN_WHEN_MARKET_IS_CLOSED = (
     os.getenv("RUN_EVEN_WHEN_MARKET_IS_CLOSED", "false").strip().lower() == "true"
@@ -54,6 +55,12 @@ def create_traders() -> List[Trader]:
     traders = []
     for name, lastname, model_name in zip(names, lastnames, model_names):
         traders.append(Trader(name, lastname, model_name))
+
+    # Warm the provider cache once per unique model, so the first cycle's
+    # four concurrent agent builds don't all initialize providers at once
+    for model_name in set(model_names):
+        ModelProvider.get_strands_model(model_name)
+
     return traders
 
 
@@ -69,36 +76,85 @@ async def run_every_n_minutes():
     5. Continues indefinitely until interrupted
     """
     traders = create_traders()
-    
-    print(f"Created {len(traders)} traders:")
-    for trader in traders:
-        print(f"  - {trader.name} ({trader.lastname}) using {trader.model_name}")
-    
+
+    print("\n".join(
+        [f"Created {len(traders)} traders:"]
+        + [
+            f"  - {trader.name} ({trader.lastname}) using {trader.model_name}"
+            for trader in traders
+        ]
+    ))
+
+    # Start the shared MCP servers once; traders reuse them every cycle
+    await pool.startup()
+    try:
+        await _run_cycles(traders)
+    finally:
+        await pool.shutdown()
+
+
+async def _run_and_report(trader: Trader):
+    """
+    Run one trader and report its outcome as soon as it finishes.
+
+    Returns:
+        Tuple of (trader name, exception or None)
+    """
+    try:
+        await trader.run()
+    except Exception as e:
+        print(f"⚠ {trader.name} encountered error: {e}")
+        return trader.name, e
+    print(f"✓ {trader.name} completed successfully")
+    return trader.name, None
+
+
+async def _run_cycles(traders: List[Trader]):
+    """
+    Run trading cycles forever, reusing the already-started MCP pool.
+
+    Cycles are scheduled against a monotonic deadline rather than sleeping
+    after each cycle finishes, so a slow cycle (minutes of LLM time) does
+    not drift the schedule. If a cycle overruns one or more slots, the
+    missed slots are skipped instead of being run back to back, and a
+    semaphore guarantees a still-running cycle is never re-entered.
+    """
+    loop = asyncio.get_running_loop()
+    cycle_gate = asyncio.Semaphore(1)
+    interval = RUN_EVERY_N_MINUTES * 60
+    next_tick = loop.time()
+
     while True:
         if RUN_EVEN_WHEN_MARKET_IS_CLOSED or is_market_open():
-            print(f"\n{'='*60}")
-            print(f"Running trading cycle at {asyncio.get_event_loop().time()}")
-            print(f"{'='*60}\n")
-            
-            results = await asyncio.gather(
-                *[trader.run() for trader in traders],
-                return_exceptions=True
-            )
-            
-            for trader, result in zip(traders, results):
-                if isinstance(result, Exception):
-                    print(f"⚠ {trader.name} encountered error: {result}")
-                else:
-                    print(f"✓ {trader.name} completed successfully")
-            
-            print(f"\n{'='*60}")
-            print(f"Trading cycle complete")
-            print(f"{'='*60}\n")
+            async with cycle_gate:
+                begin_cycle()
+                # One buffered write per status block, not one per line;
+                # each print flushes stdout, which can block on piped output
+                print(
+                    f"\n{'='*60}\n"
+                    f"Running trading cycle at {datetime.now().isoformat()}\n"
+                    f"{'='*60}\n"
+                )
+
+                # as_completed (rather than gather) reports each trader the
+                # moment it finishes instead of waiting on the slowest one
+                for finished in asyncio.as_completed(
+                    [_run_and_report(trader) for trader in traders]
+                ):
+                    await finished
+
+                print(f"\n{'='*60}\nTrading cycle complete\n{'='*60}\n")
         else:
             print("Market is closed, skipping run")
-        
-        print(f"Sleeping for {RUN_EVERY_N_MINUTES} minutes...")
-        await asyncio.sleep(RUN_EVERY_N_MINUTES * 60)
+
+        next_tick += interval
+        now = loop.time()
+        if now > next_tick:
+            # The cycle overran the next slot; skip missed slots entirely
+            next_tick = now + interval
+
+        print(f"Sleeping for {(next_tick - now) / 60:.1f} minutes...")
+        await asyncio.sleep(next_tick - now)
 
 
 async def run_once():
@@ -110,34 +166,45 @@ async def run_once():
     """
     traders = create_traders()
     
-    print(f"\n{'='*60}")
-    print(f"Single Cycle Test - Running {len(traders)} traders")
-    print(f"{'='*60}\n")
-    
-    for trader in traders:
-        print(f"  - {trader.name} ({trader.lastname}) using {trader.model_name}")
-    print()
-    
-    results = await asyncio.gather(
-        *[trader.run() for trader in traders],
-        return_exceptions=True
-    )
-    
-    print(f"\n{'='*60}")
-    print("Results:")
-    print(f"{'='*60}")
-    
+    print("\n".join(
+        [
+            f"\n{'='*60}",
+            f"Single Cycle Test - Running {len(traders)} traders",
+            f"{'='*60}\n",
+        ]
+        + [
+            f"  - {trader.name} ({trader.lastname}) using {trader.model_name}"
+            for trader in traders
+        ]
+    ) + "\n")
+
+    begin_cycle()
+    await pool.startup()
+    errors = {}
+    try:
+        # Report each trader as it finishes rather than waiting on the slowest
+        for finished in asyncio.as_completed(
+            [_run_and_report(trader) for trader in traders]
+        ):
+            name, error = await finished
+            errors[name] = error
+    finally:
+        await pool.shutdown()
+
+    lines = [f"\n{'='*60}", "Results:", f"{'='*60}"]
     success_count = 0
-    for trader, result in zip(traders, results):
-        if isinstance(result, Exception):
-            print(f"✗ {trader.name}: Failed - {result}")
+    for trader in traders:
+        error = errors.get(trader.name)
+        if error is not None:
+            lines.append(f"✗ {trader.name}: Failed - {error}")
         else:
-            print(f"✓ {trader.name}: Completed")
+            lines.append(f"✓ {trader.name}: Completed")
             success_count += 1
-    
-    print(f"\n{success_count}/{len(traders)} traders completed successfully")
-    print(f"{'='*60}\n")
-    
+
+    lines.append(f"\n{success_count}/{len(traders)} traders completed successfully")
+    lines.append(f"{'='*60}\n")
+    print("\n".join(lines))
+
     return success_count == len(traders)
 
 
@@ -2,12 +2,12 @@ import gradio as gr
 from util import css, js, Color
 import pandas as pd
 import os
-from dotenv import load_dotenv
 import plotly.express as px
+from core.env_bootstrap import ensure_env
 from infrastructure.accounts import Account
 from infrastructure.database import read_log
 
-load_dotenv(override=True)
+ensure_env()
 
 USE_LEGACY = os.getenv("USE_LEGACY_AGENTS", "false").strip().lower() == "true"
 
@@ -4,6 +4,7 @@ Core Utilities
 Shared utilities used across the trading system.
 """
 
+from .env_bootstrap import ensure_env
 from .model_providers import ModelProvider, create_strands_model, create_openai_agents_model
 from .templates import (
     researcher_instructions,
@@ -17,8 +18,12 @@ from .observability import (
     create_log_hook,
     make_trace_id
 )
+from .tool_cache import ToolResultCache, research_cache, begin_cycle
 
 __all__ = [
+    # Environment
+    "ensure_env",
+
     # Model providers
     "ModelProvider",
     "create_strands_model",
@@ -35,4 +40,9 @@ __all__ = [
     "StrandsLogHook",
     "create_log_hook",
     "make_trace_id",
+
+    # Tool caching
+    "ToolResultCache",
+    "research_cache",
+    "begin_cycle",
 ]
@@ -0,0 +1,36 @@
+"""
+Environment Bootstrap
+
+Loads the .env file exactly once per process and installs uvloop.
+
+Several entry points and library modules need the environment populated
+before reading API keys. Each used to call load_dotenv on import, so a
+process importing more than one of them re-read and re-parsed .env every
+time. ensure_env() is idempotent: the first caller pays the file parse,
+everyone else hits the sentinel. The DOTENV_LOADED sentinel lives in
+os.environ (not a module global) so it also covers subprocesses that
+inherit the environment.
+
+uvloop rides along here because every entry point that bootstraps the
+environment goes on to call asyncio.run, and the workload — MCP stdio
+pipes plus LLM HTTP calls — is exactly the small-await-heavy I/O uvloop
+is built for. It's optional (unavailable on Windows); without it the
+default event loop is used.
+"""
+
+import os
+from dotenv import load_dotenv
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def ensure_env() -> None:
+    """Load .env once per process; later calls are a single dict probe."""
+    if uvloop is not None:
+        uvloop.install()
+    if not os.getenv("DOTENV_LOADED"):
+        load_dotenv(override=True)
+        os.environ["DOTENV_LOADED"] = "1"
@@ -15,10 +15,74 @@ Usage:
 """
 
 from typing import Any
+import functools
+import importlib
 import os
-from dotenv import load_dotenv
+from types import MappingProxyType
+from core.env_bootstrap import ensure_env
 
-load_dotenv(override=True)
+ensure_env()
+
+# SDK classes resolved lazily on first use (PEP 562), so importing this
+# module doesn't pay for both agent SDKs, and repeated factory calls skip
+# the per-call `import` statement machinery
+_LAZY = {
+    "OpenAIModel": ("strands.models.openai", "OpenAIModel"),
+    "AsyncOpenAI": ("openai", "AsyncOpenAI"),
+    "OpenAIChatCompletionsModel": ("agents", "OpenAIChatCompletionsModel"),
+}
+
+
+def _load_lazy(name: str) -> Any:
+    """Import a lazily-bound SDK class once and cache it in module globals."""
+    module_name, attr = _LAZY[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        return _load_lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# One shared httpx client per base_url; every AsyncOpenAI built for that
+# provider reuses its connection pool instead of opening (and TLS
+# handshaking) a private one
+_HTTPX_CLIENTS: dict = {}
+
+
+def _shared_httpx(base_url):
+    """Get the shared httpx.AsyncClient for a provider base_url."""
+    import httpx
+
+    client = _HTTPX_CLIENTS.get(base_url)
+    if client is None:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("OAI_MAX_CONN", "1000")),
+                max_keepalive_connections=int(os.getenv("OAI_MAX_KEEPALIVE", "100")),
+            ),
+            timeout=httpx.Timeout(120.0),
+        )
+        _HTTPX_CLIENTS[base_url] = client
+    return client
+
+
+# Provider API keys snapshotted once at import (right after ensure_env);
+# they are process-constant, and the read-only proxy makes accidental
+# mutation impossible while costing a single dict probe per lookup
+_ENV = MappingProxyType({
+    key: os.environ.get(key)
+    for key in (
+        "OPENAI_API_KEY",
+        "DEEPSEEK_API_KEY",
+        "GROK_API_KEY",
+        "GOOGLE_API_KEY",
+        "OPENROUTER_API_KEY",
+    )
+})
 
 
 class ModelProvider:
@@ -28,59 +92,104 @@ class ModelProvider:
     GROK_BASE_URL = "https://api.x.ai/v1"
     GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai/"
     OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
-    
+
+    # (model-name token, env var, base url) checked in order; model names
+    # with no matching token fall through to OpenAI with the default url
+    _PROVIDER_ROUTES = (
+        ("/", "OPENROUTER_API_KEY", OPENROUTER_BASE_URL),
+        ("deepseek", "DEEPSEEK_API_KEY", DEEPSEEK_BASE_URL),
+        ("grok", "GROK_API_KEY", GROK_BASE_URL),
+        ("gemini", "GOOGLE_API_KEY", GEMINI_BASE_URL),
+    )
+
+    # Fast path keyed on the model name's leading "-" segment; covers every
+    # model name this system actually uses with one split + one dict probe
+    _FAST_ROUTES = {
+        "deepseek": ("DEEPSEEK_API_KEY", DEEPSEEK_BASE_URL),
+        "grok": ("GROK_API_KEY", GROK_BASE_URL),
+        "gemini": ("GOOGLE_API_KEY", GEMINI_BASE_URL),
+        "gpt": ("OPENAI_API_KEY", None),
+    }
+
     @staticmethod
+    def _resolve(model_name: str) -> tuple:
+        """
+        Resolve a model name to its provider credentials.
+
+        Args:
+            model_name: Model identifier
+
+        Returns:
+            Tuple of (api_key, base_url); base_url is None for OpenAI
+        """
+        route = ModelProvider._FAST_ROUTES.get(model_name.split("-", 1)[0])
+        if route is not None:
+            key_name, base_url = route
+            return _ENV[key_name], base_url
+
+        for token, key_name, base_url in ModelProvider._PROVIDER_ROUTES:
+            if token in model_name:
+                return _ENV[key_name], base_url
+        return _ENV["OPENAI_API_KEY"], None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _client_args(model_name: str) -> dict:
+        """
+        Build (once per model name) the client_args dict for a model.
+
+        Args:
+            model_name: Model identifier
+
+        Returns:
+            Dict with api_key and, for non-OpenAI providers, base_url
+        """
+        api_key, base_url = ModelProvider._resolve(model_name)
+        if base_url:
+            return {"api_key": api_key, "base_url": base_url}
+        return {"api_key": api_key}
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_strands_model(model_name: str) -> Any:
         """
         Get Strands-compatible model instance.
-        
+
+        The instance is cached per model name, so traders sharing a model
+        share one provider (and its HTTP client) instead of re-initializing
+        it on every agent build.
+
         Args:
             model_name: Model identifier (e.g., "gpt-4o-mini", "deepseek-chat")
-            
+
         Returns:
             Strands Model instance
-            
+
         Note:
             Uses the actual Strands API discovered in Phase 0:
             - Import from strands.models.openai (not strands.models)
             - Use model_id parameter (not model)
             - Use client_args for API configuration
         """
-        from strands.models.openai import OpenAIModel
-        
-        if "/" in model_name:
-            api_key = os.getenv("OPENROUTER_API_KEY")
-            base_url = ModelProvider.OPENROUTER_BASE_URL
-        elif "deepseek" in model_name:
-            api_key = os.getenv("DEEPSEEK_API_KEY")
-            base_url = ModelProvider.DEEPSEEK_BASE_URL
-        elif "grok" in model_name:
-            api_key = os.getenv("GROK_API_KEY")
-            base_url = ModelProvider.GROK_BASE_URL
-        elif "gemini" in model_name:
-            api_key = os.getenv("GOOGLE_API_KEY")
-            base_url = ModelProvider.GEMINI_BASE_URL
-        else:
-            api_key = os.getenv("OPENAI_API_KEY")
-            base_url = None
-        
-        client_args = {"api_key": api_key}
-        if base_url:
-            client_args["base_url"] = base_url
-        
+        OpenAIModel = globals().get("OpenAIModel") or _load_lazy("OpenAIModel")
+
         return OpenAIModel(
             model_id=model_name,
-            client_args=client_args
+            client_args=ModelProvider._client_args(model_name)
         )
     
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def get_strands_model_with_litellm(model_name: str) -> Any:
         """
         Get Strands model using LiteLLM for unified multi-provider support.
-        
+
         This is an alternative approach that uses LiteLLM to handle all providers.
         Requires: uv pip install litellm
-        
+
+        The instance is cached per model name, like get_strands_model.
+
         Args:
             model_name: Model identifier
             
@@ -97,72 +206,45 @@ class ModelProvider:
                 "LiteLLM not available. Install with: uv pip install litellm"
             )
         
-        if "/" in model_name:
-            api_key = os.getenv("OPENROUTER_API_KEY")
-            base_url = ModelProvider.OPENROUTER_BASE_URL
-        elif "deepseek" in model_name:
-            api_key = os.getenv("DEEPSEEK_API_KEY")
-            base_url = ModelProvider.DEEPSEEK_BASE_URL
-        elif "grok" in model_name:
-            api_key = os.getenv("GROK_API_KEY")
-            base_url = ModelProvider.GROK_BASE_URL
-        elif "gemini" in model_name:
-            api_key = os.getenv("GOOGLE_API_KEY")
-            base_url = ModelProvider.GEMINI_BASE_URL
-        else:
-            api_key = os.getenv("OPENAI_API_KEY")
-            base_url = None
-        
         return LiteLLMModel(
             model_id=model_name,
-            client_args={
-                "api_key": api_key,
-                "base_url": base_url
-            } if base_url else {"api_key": api_key}
+            client_args=ModelProvider._client_args(model_name)
         )
     
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def get_openai_agents_model(model_name: str) -> Any:
         """
         Get OpenAI Agents SDK model instance (legacy implementation).
-        
+
         This preserves the existing logic from traders.py for backward compatibility.
-        
+        The instance is cached per model name, so repeated lookups share one
+        model object (and its underlying client).
+
         Args:
             model_name: Model identifier
             
         Returns:
             OpenAI Agents Model instance (typically OpenAIChatCompletionsModel)
         """
-        from agents import OpenAIChatCompletionsModel
-        from openai import AsyncOpenAI
-        
-        if "/" in model_name:
-            client = AsyncOpenAI(
-                base_url=ModelProvider.OPENROUTER_BASE_URL,
-                api_key=os.getenv("OPENROUTER_API_KEY")
-            )
-        elif "deepseek" in model_name:
-            client = AsyncOpenAI(
-                base_url=ModelProvider.DEEPSEEK_BASE_URL,
-                api_key=os.getenv("DEEPSEEK_API_KEY")
-            )
-        elif "grok" in model_name:
-            client = AsyncOpenAI(
-                base_url=ModelProvider.GROK_BASE_URL,
-                api_key=os.getenv("GROK_API_KEY")
-            )
-        elif "gemini" in model_name:
-            client = AsyncOpenAI(
-                base_url=ModelProvider.GEMINI_BASE_URL,
-                api_key=os.getenv("GOOGLE_API_KEY")
-            )
-        else:
+        OpenAIChatCompletionsModel = (
+            globals().get("OpenAIChatCompletionsModel")
+            or _load_lazy("OpenAIChatCompletionsModel")
+        )
+        AsyncOpenAI = globals().get("AsyncOpenAI") or _load_lazy("AsyncOpenAI")
+
+        api_key, base_url = ModelProvider._resolve(model_name)
+        if base_url is None:
+            # Plain OpenAI models are passed through by name in the legacy SDK
             return model_name
-        
+
         return OpenAIChatCompletionsModel(
             model=model_name,
-            openai_client=client
+            openai_client=AsyncOpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                http_client=_shared_httpx(base_url)
+            )
         )
 
 
@@ -202,27 +284,37 @@ if __name__ == "__main__":
         """Test model provider creation"""
         print("Testing Model Providers\n")
         
-        print("=== Strands Models ===")
         models_to_test = [
             "gpt-4o-mini",
             "deepseek-chat",
             "grok-3-mini-beta",
             "gemini-2.5-flash-preview-04-17"
         ]
-        
-        for model_name in models_to_test:
-            try:
-                model = ModelProvider.get_strands_model(model_name)
+
+        # Constructors are sync (and allocate HTTP clients), so fan them
+        # out on worker threads instead of building eight models in series
+        print("=== Strands Models ===")
+        results = await asyncio.gather(
+            *(asyncio.to_thread(ModelProvider.get_strands_model, m)
+              for m in models_to_test),
+            return_exceptions=True
+        )
+        for model_name, result in zip(models_to_test, results):
+            if isinstance(result, Exception):
+                print(f"✗ Failed to create {model_name}: {result}")
+            else:
                 print(f"✓ Created Strands model: {model_name}")
-            except Exception as e:
-                print(f"✗ Failed to create {model_name}: {e}")
-        
+
         print("\n=== OpenAI Agents Models ===")
-        for model_name in models_to_test:
-            try:
-                model = ModelProvider.get_openai_agents_model(model_name)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(ModelProvider.get_openai_agents_model, m)
+              for m in models_to_test),
+            return_exceptions=True
+        )
+        for model_name, result in zip(models_to_test, results):
+            if isinstance(result, Exception):
+                print(f"✗ Failed to create {model_name}: {result}")
+            else:
                 print(f"✓ Created OpenAI Agents model: {model_name}")
-            except Exception as e:
-                print(f"✗ Failed to create {model_name}: {e}")
     
     asyncio.run(test_providers())
@@ -20,108 +20,149 @@ from strands.hooks import (
     BeforeModelCallEvent,
     AfterModelCallEvent,
 )
-from infrastructure.database import write_log
+from infrastructure.database import write_logs_batch
+from datetime import datetime
 from typing import Optional
+import asyncio
 import secrets
-import string
+
+
+# How long the background writer waits between batch flushes
+LOG_FLUSH_INTERVAL = 0.05
+
+
+class TurnLimitExceeded(RuntimeError):
+    """Raised by the log hook when an invocation exceeds its turn budget"""
 
 
 class StrandsLogHook(HookProvider):
     """
     Hook provider that logs Strands agent events to the database.
-    
+
     This adapter provides similar functionality to the original LogTracer
     but uses Strands' hooks system instead of OpenAI Agents TracingProcessor.
+
+    Log entries are queued and flushed in batches by a background task
+    (single executemany per flush window) rather than one INSERT per hook
+    event, keeping SQLite I/O out of the hot agent loop.
     """
-    
-    def __init__(self, trader_name: str):
+
+    def __init__(self, trader_name: str, max_turns: Optional[int] = None):
         """
         Initialize the log hook for a specific trader.
-        
+
         Args:
             trader_name: Name of the trader (for log correlation)
+            max_turns: Abort the invocation with TurnLimitExceeded after
+                this many model calls; None disables the cap
         """
         self.trader_name = trader_name
-    
+        self.max_turns = max_turns
+        self._turn_count = 0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closing = False
+        # Tool names called during the current invocation, in order;
+        # read by the trader to build reusable plan templates
+        self.tool_sequence: list = []
+
+    def _enqueue(self, type: str, message: str) -> None:
+        """Queue a log entry and make sure the background writer is running"""
+        self._queue.put_nowait(
+            (self.trader_name.lower(), datetime.now().isoformat(), type, message)
+        )
+        if self._writer_task is None or self._writer_task.done():
+            self._closing = False
+            self._writer_task = asyncio.ensure_future(self._drain_loop())
+
+    async def _flush(self) -> None:
+        """Drain the queue and write all pending entries in one batch"""
+        rows = []
+        while True:
+            try:
+                rows.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if rows:
+            # The sqlite commit (and its disk I/O) runs on a worker thread
+            # so it never stalls the event loop shared by all traders
+            await asyncio.to_thread(write_logs_batch, rows)
+
+    async def _drain_loop(self) -> None:
+        """Background task that flushes queued log entries periodically"""
+        while not self._closing or not self._queue.empty():
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            await self._flush()
+
+    async def _stop_writer(self) -> None:
+        """Signal the writer to stop and wait for the final flush"""
+        self._closing = True
+        if self._writer_task is not None:
+            await self._writer_task
+            self._writer_task = None
+
     async def before_invocation(self, event: BeforeInvocationEvent) -> None:
         """Called before agent invocation starts"""
-        write_log(
-            self.trader_name,
-            "agent",
-            f"Started invocation"
-        )
-    
+        self.tool_sequence = []
+        self._turn_count = 0
+        self._enqueue("agent", f"Started invocation")
+
     async def after_invocation(self, event: AfterInvocationEvent) -> None:
         """Called after agent invocation completes"""
-        stop_reason = event.result.stop_reason if hasattr(event.result, 'stop_reason') else 'unknown'
-        write_log(
-            self.trader_name,
-            "agent",
-            f"Ended invocation - stop reason: {stop_reason}"
-        )
-    
+        stop_reason = getattr(event.result, 'stop_reason', 'unknown')
+        self._enqueue("agent", f"Ended invocation - stop reason: {stop_reason}")
+        await self._stop_writer()
+
     async def before_tool_call(self, event: BeforeToolCallEvent) -> None:
         """Called before a tool is invoked"""
-        tool_name = event.tool_use.name if hasattr(event.tool_use, 'name') else 'unknown'
-        write_log(
-            self.trader_name,
-            "function",
-            f"Started {tool_name}"
-        )
-    
+        tool_name = getattr(event.tool_use, 'name', 'unknown')
+        self.tool_sequence.append(tool_name)
+        self._enqueue("function", f"Started {tool_name}")
+
     async def after_tool_call(self, event: AfterToolCallEvent) -> None:
         """Called after a tool invocation completes"""
-        tool_name = event.tool_use.name if hasattr(event.tool_use, 'name') else 'unknown'
-        
+        tool_name = getattr(event.tool_use, 'name', 'unknown')
+
         if event.exception:
-            write_log(
-                self.trader_name,
-                "function",
-                f"Ended {tool_name} - error: {event.exception}"
-            )
+            self._enqueue("function", f"Ended {tool_name} - error: {event.exception}")
         else:
-            write_log(
-                self.trader_name,
-                "function",
-                f"Ended {tool_name}"
-            )
-    
+            self._enqueue("function", f"Ended {tool_name}")
+
     async def before_model_call(self, event: BeforeModelCallEvent) -> None:
         """Called before LLM is invoked"""
-        write_log(
-            self.trader_name,
-            "generation",
-            "Started model call"
-        )
-    
+        self._turn_count += 1
+        if self.max_turns is not None and self._turn_count > self.max_turns:
+            # A ReAct loop that hasn't converged in max_turns model calls
+            # won't; cut it off rather than burn tokens indefinitely
+            self._enqueue(
+                "agent", f"Aborting: exceeded turn limit of {self.max_turns}"
+            )
+            raise TurnLimitExceeded(
+                f"Invocation exceeded {self.max_turns} model calls"
+            )
+        self._enqueue("generation", "Started model call")
+
     async def after_model_call(self, event: AfterModelCallEvent) -> None:
         """Called after LLM invocation completes"""
-        write_log(
-            self.trader_name,
-            "response",
-            "Ended model call"
-        )
+        self._enqueue("response", "Ended model call")
 
 
-def create_log_hook(trader_name: str) -> StrandsLogHook:
+def create_log_hook(trader_name: str, max_turns: Optional[int] = None) -> StrandsLogHook:
     """
     Create a log hook for a trader.
-    
+
     Args:
         trader_name: Name of the trader
-        
+        max_turns: Optional cap on model calls per invocation
+
     Returns:
         Configured StrandsLogHook instance
-        
+
     Example:
-        hook = create_log_hook("Warren")
+        hook = create_log_hook("Warren", max_turns=30)
         agent = Agent(..., hooks=[hook])
     """
-    return StrandsLogHook(trader_name)
-
-
-# For backward compatibility with trace_id pattern
-ALPHANUM = string.ascii_lowercase + string.digits
+    return StrandsLogHook(trader_name, max_turns=max_turns)
 
 
 def make_trace_id(tag: str) -> str:
@@ -140,7 +181,9 @@ def make_trace_id(tag: str) -> str:
     """
     tag += "0"
     pad_len = 32 - len(tag)
-    random_suffix = ''.join(secrets.choice(ALPHANUM) for _ in range(pad_len))
+    # One token_hex call (hex is lowercase alphanumeric) instead of a
+    # per-character secrets.choice loop hitting os.urandom each time
+    random_suffix = secrets.token_hex((pad_len + 1) // 2)[:pad_len]
     return f"trace_{tag}{random_suffix}"
 
 
@@ -1,3 +1,4 @@
+import functools
 from datetime import datetime
 from infrastructure.market import is_paid_polygon, is_realtime_polygon
 
@@ -9,8 +10,9 @@ else:
     note = "You have access to end of day market data; use you get_share_price tool to get the share price as of the prior close."
 
 
-def researcher_instructions():
-    return f"""You are a financial researcher. You are able to search the web for interesting financial news,
+# Static body of the researcher prompt; kept as a stable prefix so only the
+# trailing datetime line changes between renders
+_RESEARCHER_INSTRUCTIONS = """You are a financial researcher. You are able to search the web for interesting financial news,
 look for possible trading opportunities, and help with research.
 Based on the request, you carry out necessary research and respond with your findings.
 Take time to make multiple searches to get a comprehensive overview, and then summarize your findings.
@@ -23,28 +25,40 @@ you have worked on previously, and store new information about companies, stocks
 Also use it to store web addresses that you find interesting so you can check them later.
 Draw on your knowledge graph to build your expertise over time.
 
-If there isn't a specific request, then just respond with investment opportunities based on searching latest news.
+If there isn't a specific request, then just respond with investment opportunities based on searching latest news."""
+
+
+def researcher_instructions():
+    return f"""{_RESEARCHER_INSTRUCTIONS}
 The current datetime is {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 """
 
+@functools.lru_cache(maxsize=1)
 def research_tool():
     return "This tool researches online for news and opportunities, \
 either based on your specific request to look into a certain stock, \
 or generally for notable financial news and opportunities. \
 Describe what kind of research you're looking for."
 
-def trader_instructions(name: str):
-    return f"""
-You are {name}, a trader on the stock market. Your account is under your name, {name}.
-You actively manage your portfolio according to your strategy.
+# Static rules block shared verbatim by every trader; keeping it as an
+# identical prefix lets provider prompt caches reuse the prefill across
+# traders and turns, with only the name line varying at the end
+_TRADER_INSTRUCTIONS = f"""
+You are a trader on the stock market. You actively manage your portfolio according to your strategy.
 You have access to tools including a researcher to research online for news and opportunities, based on your request.
 You also have tools to access to financial data for stocks. {note}
-And you have tools to buy and sell stocks using your account name {name}.
+And you have tools to buy and sell stocks using your account name.
 You can use your entity tools as a persistent memory to store and recall information; you share
 this memory with other traders and can benefit from the group's knowledge.
 Use these tools to carry out research, make decisions, and execute trades.
 After you've completed trading, send a push notification with a brief summary of activity, then reply with a 2-3 sentence appraisal.
-Your goal is to maximize your profits according to your strategy.
+Your goal is to maximize your profits according to your strategy."""
+
+
+@functools.lru_cache(maxsize=16)
+def trader_instructions(name: str):
+    return f"""{_TRADER_INSTRUCTIONS}
+You are {name}, and your account is under your name, {name}.
 """
 
 def trade_message(name, strategy, account):
@@ -0,0 +1,147 @@
+"""
+Tool Result Cache
+
+Cycle-scoped cache for expensive tool results.
+
+Traders frequently issue overlapping research requests within the same
+trading cycle (e.g. all four asking about SPY), and each one costs a full
+researcher sub-agent run. Results are cached keyed by (cycle, tool name,
+canonical arguments) with a TTL, and the cycle id is carried in a
+contextvar set by the trading floor so results never leak across cycles.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    # Optional dependency; without it query matching falls back to
+    # canonicalized exact matching
+    SentenceTransformer = None
+
+# Identifies the current trading cycle; part of every cache key
+cycle_id = contextvars.ContextVar("cycle_id", default=0)
+
+# Default time-to-live for cached tool results, in seconds
+DEFAULT_TTL = 15 * 60
+
+
+def begin_cycle() -> int:
+    """
+    Start a new trading cycle.
+
+    Results cached in earlier cycles stop matching, since the cycle id is
+    part of every cache key.
+
+    Returns:
+        The new cycle id
+    """
+    new_id = cycle_id.get() + 1
+    cycle_id.set(new_id)
+    return new_id
+
+
+class ToolResultCache:
+    """
+    TTL cache for tool results, keyed by (cycle, tool name, arguments).
+
+    Entries evict lazily on read when expired, and the oldest entry is
+    dropped when the cache is full.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = DEFAULT_TTL):
+        self._entries: dict = {}
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, tool_name: str, args_key):
+        """Return the cached result for this cycle, or None on a miss."""
+        key = (cycle_id.get(), tool_name, args_key)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if time.monotonic() > expires:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def put(self, tool_name: str, args_key, value) -> None:
+        """Cache a result for the current cycle."""
+        if len(self._entries) >= self._maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        key = (cycle_id.get(), tool_name, args_key)
+        self._entries[key] = (value, time.monotonic() + self._ttl)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+
+def canonical_query(query: str) -> str:
+    """Collapse casing and whitespace so trivial variants share a key."""
+    return " ".join(query.lower().split())
+
+
+class SemanticQueryIndex:
+    """
+    Near-duplicate query matcher for tool-result cache keys.
+
+    With sentence-transformers installed, a query that embeds within
+    `threshold` cosine similarity of an earlier one resolves to that
+    query's key, so rephrasings ("news on AAPL today" / "today's AAPL
+    news") hit the same cached research. Without it, resolve() is just
+    the canonicalized query — no extra dependency required.
+    """
+
+    def __init__(self, threshold: float = 0.92, maxsize: int = 512):
+        self._threshold = threshold
+        self._maxsize = maxsize
+        self._model = None
+        # Guards one-time model loading across worker threads
+        self._model_lock = threading.Lock()
+        # List of (unit-norm embedding, canonical key), oldest first
+        self._entries: list = []
+
+    def _embed(self, text: str):
+        # Runs in a worker thread (see resolve): loading the model takes
+        # seconds on first use and encode is CPU-bound, neither belongs on
+        # the event loop shared by all traders
+        import numpy as np
+
+        with self._model_lock:
+            if self._model is None:
+                self._model = SentenceTransformer("all-MiniLM-L6-v2")
+        vec = self._model.encode([text])[0].astype("float32")
+        return vec / (float(np.linalg.norm(vec)) or 1.0)
+
+    async def resolve(self, query: str) -> str:
+        """Map a query to a shared cache key, registering it if novel."""
+        key = canonical_query(query)
+        if SentenceTransformer is None:
+            return key
+
+        vec = await asyncio.to_thread(self._embed, key)
+        best_key = None
+        best_sim = 0.0
+        for other_vec, other_key in self._entries:
+            sim = float(vec @ other_vec)
+            if sim > best_sim:
+                best_key, best_sim = other_key, sim
+        if best_key is not None and best_sim >= self._threshold:
+            return best_key
+
+        if len(self._entries) >= self._maxsize:
+            self._entries.pop(0)
+        self._entries.append((vec, key))
+        return key
+
+
+# Shared cache for researcher results across all traders
+research_cache = ToolResultCache()
+
+# Shared query matcher feeding the research cache keys
+research_query_index = SemanticQueryIndex()
@@ -4,11 +4,39 @@ Infrastructure Components
 MCP servers, database utilities, and external service integrations.
 """
 
+import os
+from dotenv import load_dotenv
+
+# Load .env exactly once per process, before any submodule reads its env;
+# library modules just call os.getenv instead of re-parsing the file
+if not os.getenv("DOTENV_LOADED"):
+    load_dotenv(override=True)
+    os.environ["DOTENV_LOADED"] = "1"
+
 from .database import write_log, read_log
 from .accounts_client import read_accounts_resource, read_strategy_resource
 from .market import is_market_open
 from .mcp_params import trader_mcp_server_params, researcher_mcp_server_params
 
+# mcp_pool drags in the strands and mcp stacks; resolve its names lazily
+# (PEP 562) so consumers that never touch the pool — e.g. the gradio UI
+# importing infrastructure.accounts — don't pay those imports at startup
+_MCP_POOL_EXPORTS = {
+    "MCPClientPool",
+    "pool",
+    "get_pooled_clients",
+    "get_pooled_researcher_clients",
+    "reconnect_pooled_clients",
+}
+
+
+def __getattr__(name):
+    if name in _MCP_POOL_EXPORTS:
+        from . import mcp_pool
+        return getattr(mcp_pool, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Database
     "write_log",
@@ -24,4 +52,9 @@ __all__ = [
     # MCP
     "trader_mcp_server_params",
     "researcher_mcp_server_params",
+    "MCPClientPool",
+    "pool",
+    "get_pooled_clients",
+    "get_pooled_researcher_clients",
+    "reconnect_pooled_clients",
 ]
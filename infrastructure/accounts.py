@@ -1,12 +1,9 @@
 from pydantic import BaseModel
 import json
-from dotenv import load_dotenv
 from datetime import datetime
 from .market import get_share_price
 from .database import write_account, read_account, write_log
 
-load_dotenv(override=True)
-
 INITIAL_BALANCE = 10_000.0
 SPREAD = 0.002
 
@@ -150,13 +147,20 @@ class Account(BaseModel):
         """ List all transactions made by the user. """
         return [transaction.model_dump() for transaction in self.transactions]
     
-    def report(self) -> str:
-        """ Return a json string representing the account.  """
+    def report(self, include_time_series: bool = True) -> str:
+        """ Return a json string representing the account.
+
+        The time series is still recorded either way; include_time_series
+        only controls whether it ships in the returned payload (it grows
+        without bound and dominates the report for long-lived accounts).
+        """
         portfolio_value = self.calculate_portfolio_value()
         self.portfolio_value_time_series.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S"), portfolio_value))
         self.save()
         pnl = self.calculate_profit_loss(portfolio_value)
         data = self.model_dump()
+        if not include_time_series:
+            data.pop("portfolio_value_time_series", None)
         data["total_portfolio_value"] = portfolio_value
         data["total_profit_loss"] = pnl
         write_log(self.name, "account", f"Retrieved account details")
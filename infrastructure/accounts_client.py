@@ -20,11 +20,14 @@ async def call_accounts_tool(tool_name, tool_args):
             result = await session.call_tool(tool_name, tool_args)
             return result
             
-async def read_accounts_resource(name):
+async def read_accounts_resource(name, include_time_series=True):
+    # The brief resource omits portfolio_value_time_series server-side,
+    # which keeps the (ever-growing) series off the wire entirely
+    resource = "accounts_server" if include_time_series else "accounts_server_brief"
     async with stdio_client(params) as streams:
         async with mcp.ClientSession(*streams) as session:
             await session.initialize()
-            result = await session.read_resource(f"accounts://accounts_server/{name}")
+            result = await session.read_resource(f"accounts://{resource}/{name}")
             return result.contents[0].text
         
 async def read_strategy_resource(name):
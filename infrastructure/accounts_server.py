@@ -61,6 +61,13 @@ async def read_account_resource(name: str) -> str:
     account = Account.get(name.lower())
     return account.report()
 
+@mcp.resource("accounts://accounts_server_brief/{name}")
+async def read_account_brief_resource(name: str) -> str:
+    # Same report minus the unbounded portfolio_value_time_series, so the
+    # series never crosses the stdio transport at all
+    account = Account.get(name.lower())
+    return account.report(include_time_series=False)
+
 @mcp.resource("accounts://strategy/{name}")
 async def read_strategy_resource(name: str) -> str:
     account = Account.get(name.lower())
@@ -1,14 +1,27 @@
 import sqlite3
 import json
 from datetime import datetime
-from dotenv import load_dotenv
-
-load_dotenv(override=True)
 
 DB = "accounts.db"
 
 
-with sqlite3.connect(DB) as conn:
+def _connect() -> sqlite3.Connection:
+    """
+    Open a connection to the accounts database with WAL mode enabled.
+
+    WAL lets readers proceed while a writer commits, and
+    synchronous=NORMAL drops the per-commit fsync that stalls
+    log-heavy agent runs (the WAL still makes commits durable
+    on checkpoint).
+    """
+    conn = sqlite3.connect(DB)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+with _connect() as conn:
     cursor = conn.cursor()
     cursor.execute('CREATE TABLE IF NOT EXISTS accounts (name TEXT PRIMARY KEY, account TEXT)')
     cursor.execute('''
@@ -21,11 +34,19 @@ with sqlite3.connect(DB) as conn:
         )
     ''')
     cursor.execute('CREATE TABLE IF NOT EXISTS market (date TEXT PRIMARY KEY, data TEXT)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS plans (
+            lastname TEXT,
+            mode TEXT,
+            plan TEXT,
+            PRIMARY KEY (lastname, mode)
+        )
+    ''')
     conn.commit()
 
 def write_account(name, account_dict):
     json_data = json.dumps(account_dict)
-    with sqlite3.connect(DB) as conn:
+    with _connect() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO accounts (name, account)
@@ -35,7 +56,7 @@ def write_account(name, account_dict):
         conn.commit()
 
 def read_account(name):
-    with sqlite3.connect(DB) as conn:
+    with _connect() as conn:
         cursor = conn.cursor()
         cursor.execute('SELECT account FROM accounts WHERE name = ?', (name.lower(),))
         row = cursor.fetchone()
@@ -52,7 +73,7 @@ def write_log(name: str, type: str, message: str):
     """
     now = datetime.now().isoformat()
     
-    with sqlite3.connect(DB) as conn:
+    with _connect() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO logs (name, datetime, type, message)
@@ -60,6 +81,28 @@ def write_log(name: str, type: str, message: str):
         ''', (name.lower(), type, message))
         conn.commit()
 
+def write_logs_batch(rows):
+    """
+    Write multiple log entries to the logs table in a single transaction.
+
+    Batching collapses many per-event INSERTs (and their commits) into one,
+    which keeps log-heavy agent runs off the fsync path.
+
+    Args:
+        rows: Iterable of (name, datetime, type, message) tuples
+    """
+    rows = list(rows)
+    if not rows:
+        return
+
+    with _connect() as conn:
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT INTO logs (name, datetime, type, message)
+            VALUES (?, ?, ?, ?)
+        ''', rows)
+        conn.commit()
+
 def read_log(name: str, last_n=10):
     """
     Read the most recent log entries for a given name.
@@ -71,7 +114,7 @@ def read_log(name: str, last_n=10):
     Returns:
         list: A list of tuples containing (datetime, type, message)
     """
-    with sqlite3.connect(DB) as conn:
+    with _connect() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT datetime, type, message FROM logs 
@@ -82,9 +125,47 @@ def read_log(name: str, last_n=10):
         
         return reversed(cursor.fetchall())
 
+def write_plan(lastname: str, mode: str, plan: str) -> None:
+    """
+    Store the tool-call plan that worked for a strategy/mode pair.
+
+    Args:
+        lastname (str): Trader strategy identifier
+        mode (str): "trade" or "rebalance"
+        plan (str): Rendered plan text (ordered tool calls)
+    """
+    with _connect() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO plans (lastname, mode, plan)
+            VALUES (?, ?, ?)
+            ON CONFLICT(lastname, mode) DO UPDATE SET plan=excluded.plan
+        ''', (lastname.lower(), mode, plan))
+        conn.commit()
+
+def read_plan(lastname: str, mode: str) -> str | None:
+    """
+    Read the stored plan for a strategy/mode pair, if any.
+
+    Args:
+        lastname (str): Trader strategy identifier
+        mode (str): "trade" or "rebalance"
+
+    Returns:
+        The stored plan text, or None
+    """
+    with _connect() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT plan FROM plans WHERE lastname = ? AND mode = ?',
+            (lastname.lower(), mode)
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
+
 def write_market(date: str, data: dict) -> None:
     data_json = json.dumps(data)
-    with sqlite3.connect(DB) as conn:
+    with _connect() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO market (date, data)
@@ -94,7 +175,7 @@ def write_market(date: str, data: dict) -> None:
         conn.commit()
 
 def read_market(date: str) -> dict | None:
-    with sqlite3.connect(DB) as conn:
+    with _connect() as conn:
         cursor = conn.cursor()
         cursor.execute('SELECT data FROM market WHERE date = ?', (date,))
         row = cursor.fetchone()
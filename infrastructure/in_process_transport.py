@@ -0,0 +1,78 @@
+"""
+In-Process MCP Transport
+
+Connects MCP clients to the in-repo FastMCP servers (accounts, push,
+market) over anyio memory streams instead of spawning a `uv run python -m
+...` subprocess and framing JSON-RPC over stdio pipes.
+
+Each stdio server normally costs a full interpreter cold start plus pipe
+I/O for every message; since these servers are plain Python modules living
+in this package, they can run as a task inside the client's own process.
+
+Enabled per-client by the pool when the MCP_IN_PROCESS env flag is true
+and the server params point at an `infrastructure.*` module; external
+servers (uvx/npx) always keep the stdio transport.
+"""
+
+import importlib
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import anyio
+
+
+def in_process_module(params: dict) -> Optional[str]:
+    """
+    Return the server module name if the params describe an in-repo
+    `python -m infrastructure.*` MCP server.
+
+    Args:
+        params: Server params dict with command, args and optional env
+
+    Returns:
+        The module name (e.g. "infrastructure.accounts_server") or None
+        if the server cannot be run in-process
+    """
+    args = params.get("args") or []
+    if "-m" in args and args[-1].startswith("infrastructure."):
+        return args[-1]
+    return None
+
+
+def _resolve_server(module_name: str):
+    """Import an in-repo MCP server module and return its low-level server."""
+    module = importlib.import_module(module_name)
+    return module.mcp._mcp_server
+
+
+@asynccontextmanager
+async def in_process_client(module_name: str):
+    """
+    Connect to an in-repo FastMCP server over in-memory streams.
+
+    Yields the same (read_stream, write_stream) pair as mcp's stdio_client,
+    so it can be used as an MCPClient transport callable, but the server
+    runs as a task in this process instead of a subprocess.
+
+    Args:
+        module_name: Module path of the server (e.g. "infrastructure.push_server")
+    """
+    server = _resolve_server(module_name)
+
+    client_to_server_send, client_to_server_receive = anyio.create_memory_object_stream(0)
+    server_to_client_send, server_to_client_receive = anyio.create_memory_object_stream(0)
+
+    async with anyio.create_task_group() as tg:
+        async def _run_server():
+            await server.run(
+                client_to_server_receive,
+                server_to_client_send,
+                server.create_initialization_options(),
+                raise_exceptions=False,
+            )
+
+        tg.start_soon(_run_server)
+        try:
+            yield server_to_client_receive, client_to_server_send
+        finally:
+            tg.cancel_scope.cancel()
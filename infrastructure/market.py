@@ -1,5 +1,4 @@
 from polygon import RESTClient
-from dotenv import load_dotenv
 import os
 from datetime import datetime
 import random
@@ -7,8 +6,6 @@ from .database import write_market, read_market
 from functools import lru_cache
 from datetime import timezone
 
-load_dotenv(override=True)
-
 polygon_api_key = os.getenv("POLYGON_API_KEY")
 polygon_plan = os.getenv("POLYGON_PLAN")
 
@@ -0,0 +1,226 @@
+"""
+MCP Client Pool
+
+Process-wide pool of MCP stdio clients, so each stdio server subprocess
+is spawned once per process instead of once per trader per cycle.
+
+Previously every `Trader.run_with_mcp_servers` call rebuilt its MCP stdio
+transports and spawned fresh `uv run python -m ...` subprocesses, so each
+trading cycle paid 4xN interpreter cold starts plus MCP handshakes. The
+pool keys clients by `(command, args, env)`, creates each one once, enters
+its async context at trading-floor startup, and hands out live references.
+
+For researchers this means the search and fetch servers are shared by every
+trader (their params are identical, so they hash to the same pool key) and
+only the per-trader memory server — keyed apart by its LIBSQL_URL env —
+gets its own subprocess: K shared plus N memory processes instead of N x K.
+
+Usage:
+    from infrastructure.mcp_pool import pool, get_pooled_clients
+
+    await pool.startup()                 # once, at trading-floor startup
+    clients = await get_pooled_clients() # per trader, returns live clients
+    await pool.shutdown()                # once, on exit
+"""
+
+import asyncio
+import os
+from contextlib import AsyncExitStack
+from functools import partial
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from strands.tools.mcp import MCPClient
+
+from .mcp_params import trader_mcp_server_params, researcher_mcp_server_params
+from .in_process_transport import in_process_client, in_process_module
+
+# When true, in-repo servers (accounts, push, market) run as tasks inside
+# this process over memory streams instead of stdio subprocesses
+MCP_IN_PROCESS = os.getenv("MCP_IN_PROCESS", "false").strip().lower() == "true"
+
+
+def _pool_key(params: dict) -> tuple:
+    """Build a hashable pool key from a server params dict."""
+    return (
+        params["command"],
+        tuple(params["args"]),
+        tuple(sorted((params.get("env") or {}).items())),
+    )
+
+
+# StdioServerParameters built once per pool key; reconnects and repeated
+# researcher setups reuse the parsed object instead of reallocating it
+_server_params_cache: dict[tuple, StdioServerParameters] = {}
+
+
+def _stdio_params(key: tuple, params: dict) -> StdioServerParameters:
+    """Get (building once) the StdioServerParameters for a pool key."""
+    server_params = _server_params_cache.get(key)
+    if server_params is None:
+        server_params = StdioServerParameters(
+            command=params["command"],
+            args=params["args"],
+            env=params.get("env")
+        )
+        _server_params_cache[key] = server_params
+    return server_params
+
+
+class MCPClientPool:
+    """
+    Pool of live MCPClient instances keyed by their stdio server params.
+
+    Clients are created lazily on first request and kept connected until
+    `disconnect()` is called, so repeated trading cycles reuse the same
+    subprocesses and MCP sessions.
+    """
+
+    def __init__(self):
+        # Maps pool key -> Task resolving to a live MCPClient; storing tasks
+        # lets concurrent connects for different servers overlap their
+        # subprocess startups instead of serializing on the pool lock
+        self._clients: dict[tuple, asyncio.Task] = {}
+        # Per-key exit stacks, so one dead client can be torn down and
+        # rebuilt without touching the others
+        self._stacks: dict[tuple, AsyncExitStack] = {}
+        self._lock = asyncio.Lock()
+
+    async def _open(self, key: tuple, params: dict) -> MCPClient:
+        """Create, enter and return a new MCPClient for the given params."""
+        module_name = in_process_module(params) if MCP_IN_PROCESS else None
+        if module_name:
+            make_transport = partial(in_process_client, module_name)
+        else:
+            make_transport = partial(stdio_client, _stdio_params(key, params))
+
+        client = MCPClient(
+            transport_callable=make_transport,
+            startup_timeout=120
+        )
+        stack = AsyncExitStack()
+        try:
+            await stack.enter_async_context(client)
+        except BaseException:
+            await stack.aclose()
+            raise
+        self._stacks[key] = stack
+        return client
+
+    async def connect(self, params: dict) -> MCPClient:
+        """
+        Get the pooled client for the given server params, creating and
+        entering it on first use.
+
+        Args:
+            params: Server params dict with command, args and optional env
+
+        Returns:
+            A live MCPClient connected to the server
+        """
+        key = _pool_key(params)
+        async with self._lock:
+            task = self._clients.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._open(key, params))
+                self._clients[key] = task
+        return await task
+
+    async def reconnect(self, params: dict) -> MCPClient:
+        """
+        Tear down the pooled client for the given params (if any) and
+        build a fresh one.
+
+        Used when a server subprocess dies mid-cycle: the dead client is
+        evicted and closed, then a replacement is connected, leaving the
+        rest of the pool untouched.
+
+        Args:
+            params: Server params dict with command, args and optional env
+
+        Returns:
+            A fresh live MCPClient connected to the server
+        """
+        key = _pool_key(params)
+        async with self._lock:
+            task = self._clients.pop(key, None)
+            stack = self._stacks.pop(key, None)
+
+        if task is not None:
+            try:
+                await task
+            except Exception:
+                pass
+        if stack is not None:
+            try:
+                await stack.aclose()
+            except Exception:
+                pass
+
+        return await self.connect(params)
+
+    async def disconnect(self):
+        """Close all pooled clients and their subprocesses."""
+        async with self._lock:
+            try:
+                await asyncio.gather(*self._clients.values(), return_exceptions=True)
+                for stack in self._stacks.values():
+                    try:
+                        await stack.aclose()
+                    except Exception:
+                        pass
+            finally:
+                self._clients.clear()
+                self._stacks.clear()
+
+    async def startup(self):
+        """Pre-connect the trader MCP servers (accounts, push, market) in parallel."""
+        await asyncio.gather(*[self.connect(params) for params in trader_mcp_server_params])
+
+    async def shutdown(self):
+        """Tear down the pool; alias for `disconnect()`."""
+        await self.disconnect()
+
+
+# The process-wide pool instance shared by all traders and researchers
+pool = MCPClientPool()
+
+
+async def get_pooled_clients() -> list[MCPClient]:
+    """
+    Get the pooled trader MCP clients (accounts, push, market).
+
+    Returns:
+        List of live MCPClient instances, one per trader MCP server
+    """
+    return list(await asyncio.gather(
+        *[pool.connect(params) for params in trader_mcp_server_params]
+    ))
+
+
+async def reconnect_pooled_clients() -> list[MCPClient]:
+    """
+    Rebuild the pooled trader MCP clients after a transport failure.
+
+    Returns:
+        List of fresh live MCPClient instances, one per trader MCP server
+    """
+    return list(await asyncio.gather(
+        *[pool.reconnect(params) for params in trader_mcp_server_params]
+    ))
+
+
+async def get_pooled_researcher_clients(name: str) -> list[MCPClient]:
+    """
+    Get the pooled researcher MCP clients for a trader.
+
+    The fetch and search clients are shared across traders; the memory
+    client is keyed per-trader name via its LIBSQL_URL env.
+
+    Args:
+        name: Trader name (used for memory isolation)
+
+    Returns:
+        List of live MCPClient instances, one per researcher MCP server
+    """
+    return list(await asyncio.gather(
+        *[pool.connect(params) for params in researcher_mcp_server_params(name)]
+    ))
@@ -1,11 +1,8 @@
 import os
-from dotenv import load_dotenv
 import requests
 from pydantic import BaseModel, Field
 from mcp.server.fastmcp import FastMCP
 
-load_dotenv(override=True)
-
 pushover_user = os.getenv("PUSHOVER_USER")
 pushover_token = os.getenv("PUSHOVER_TOKEN")
 pushover_url = "https://api.pushover.net/1/messages.json"
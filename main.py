@@ -19,11 +19,12 @@ Usage:
 """
 
 import os
-from dotenv import load_dotenv
 import asyncio
 import sys
+from core.env_bootstrap import ensure_env
 
-load_dotenv(override=True)
+# Loads .env exactly once per process and installs uvloop when available
+ensure_env()
 
 USE_LEGACY = os.getenv("USE_LEGACY_AGENTS", "false").strip().lower() == "true"
 
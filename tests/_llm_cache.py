@@ -0,0 +1,102 @@
+"""
+Disk-backed LLM response cache for the test scripts.
+
+Dev iteration re-runs the same small deterministic-ish prompts over and
+over, each costing a full LLM round trip (30-60s for the tool tests).
+With LLM_CACHE=1 set, install_llm_cache() patches Agent.invoke_async
+with a read-through cache keyed on sha256(model | system prompt |
+message) and stored in tests/.llm_cache.db, so repeat runs replay the
+first response in milliseconds.
+
+Test-only: nothing in the production paths imports this module, and
+without LLM_CACHE=1 install_llm_cache() is a no-op.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from types import SimpleNamespace
+
+CACHE_DB = os.path.join(os.path.dirname(__file__), ".llm_cache.db")
+
+
+def llm_cache_enabled() -> bool:
+    """True when the LLM_CACHE env flag is set"""
+    return os.getenv("LLM_CACHE", "").strip().lower() in ("1", "true")
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(CACHE_DB)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, payload TEXT)'
+    )
+    return conn
+
+
+def _key(model_name, system_prompt, message) -> str:
+    blob = "\x1f".join([str(model_name), str(system_prompt), str(message)])
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _get(key: str):
+    with _connect() as conn:
+        row = conn.execute(
+            'SELECT payload FROM responses WHERE key = ?', (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+
+def _put(key: str, payload: str) -> None:
+    with _connect() as conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO responses (key, payload) VALUES (?, ?)',
+            (key, payload)
+        )
+        conn.commit()
+
+
+def install_llm_cache() -> bool:
+    """
+    Patch strands Agent.invoke_async with the disk cache.
+
+    Returns:
+        True if the cache is active (installed now or previously)
+    """
+    if not llm_cache_enabled():
+        return False
+
+    from strands import Agent
+
+    if getattr(Agent, "_llm_cache_installed", False):
+        return True
+
+    original = Agent.invoke_async
+
+    async def cached_invoke_async(self, prompt, *args, **kwargs):
+        model_id = getattr(getattr(self, "model", None), "model_id", "unknown")
+        key = _key(model_id, getattr(self, "system_prompt", ""), prompt)
+
+        stored = _get(key)
+        if stored is not None:
+            payload = json.loads(stored)
+            return SimpleNamespace(
+                message=payload["message"],
+                stop_reason=payload["stop_reason"]
+            )
+
+        result = await original(self, prompt, *args, **kwargs)
+        try:
+            payload = json.dumps({
+                "message": result.message,
+                "stop_reason": getattr(result, "stop_reason", "end_turn"),
+            })
+        except (TypeError, AttributeError):
+            # Non-serializable result shape; hand it back uncached
+            return result
+        _put(key, payload)
+        return result
+
+    Agent.invoke_async = cached_invoke_async
+    Agent._llm_cache_installed = True
+    return True
@@ -0,0 +1,54 @@
+"""
+Per-task stdout buffering for concurrently running test coroutines.
+
+Tests print dozens of small lines; once they run under gather/TaskGroup
+those lines interleave across tasks and every print contends on the
+stdout lock. task_buffered_stdout() swaps in a proxy that routes each
+write to the buffer of the task that made it (selected via a
+ContextVar, which asyncio scopes per task), and buffered() runs one
+test with its own StringIO. Each test's block is then emitted with a
+single write, in whatever order the caller chooses.
+"""
+
+import contextlib
+import contextvars
+import io
+import sys
+
+_OUT_BUFFER: contextvars.ContextVar = contextvars.ContextVar("out_buffer", default=None)
+
+
+class TaskOutput(io.TextIOBase):
+    """stdout proxy that routes writes to the current task's buffer"""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+
+    def write(self, s):
+        target = _OUT_BUFFER.get() or self._fallback
+        return target.write(s)
+
+    def flush(self):
+        (_OUT_BUFFER.get() or self._fallback).flush()
+
+
+@contextlib.contextmanager
+def task_buffered_stdout():
+    """Install the routing proxy on sys.stdout for the duration of the block"""
+    original = sys.stdout
+    sys.stdout = TaskOutput(original)
+    try:
+        yield
+    finally:
+        sys.stdout = original
+
+
+async def buffered(test, *args):
+    """Run a test coroutine with its prints captured; returns (result, output)"""
+    buffer = io.StringIO()
+    token = _OUT_BUFFER.set(buffer)
+    try:
+        result = await test(*args)
+    finally:
+        _OUT_BUFFER.reset(token)
+    return result, buffer.getvalue()
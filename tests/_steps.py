@@ -0,0 +1,39 @@
+"""
+Shared test-step decorator for the script-style tests.
+
+Nearly every test coroutine ended with the same boilerplate:
+`except Exception: print(...); import traceback; traceback.print_exc();
+return False`. test_step() centralizes that handler — the wrapped
+coroutine just does its checks and returns True/False, and any escaping
+exception is printed once (with traceback) and converted to a False
+result so gathered siblings keep running.
+"""
+
+import functools
+import traceback
+
+
+def test_step(name: str):
+    """
+    Decorate a test coroutine with the standard failure handler.
+
+    Args:
+        name: Human-readable step name used in the failure message
+
+    Returns:
+        Decorator producing a coroutine that returns False on exception
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                print(f"\n✗ {name} failed: {e}")
+                traceback.print_exc()
+                return False
+
+        return wrapper
+
+    return decorator
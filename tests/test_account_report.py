@@ -0,0 +1,96 @@
+"""
+Unit Test - Account Report Time-Series Strip
+
+Verifies that the string-level strip of portfolio_value_time_series in
+agents.trader.strip_time_series produces valid JSON matching a full
+parse-and-pop, including the nested-JSON edge cases that force the
+fallback path.
+"""
+
+import json
+import sys
+
+from agents.trader import strip_time_series
+
+
+# (description, account JSON string)
+CASES = [
+    (
+        "series in the middle of the document",
+        '{"name": "warren", "portfolio_value_time_series": '
+        '[["2025-01-01 10:00:00", 10000.0], ["2025-01-02 10:00:00", 10100.5]], '
+        '"balance": 10000.0}',
+    ),
+    (
+        "series as the last key",
+        '{"name": "warren", "balance": 10000.0, '
+        '"portfolio_value_time_series": [["2025-01-01 10:00:00", 10000.0]]}',
+    ),
+    (
+        "series as the only key",
+        '{"portfolio_value_time_series": [["2025-01-01 10:00:00", 10000.0]]}',
+    ),
+    (
+        "empty series",
+        '{"name": "warren", "portfolio_value_time_series": [], "balance": 10000.0}',
+    ),
+    (
+        "series missing entirely",
+        '{"name": "warren", "balance": 10000.0, "holdings": {"AAPL": 5}}',
+    ),
+    (
+        "brackets inside a string elsewhere in the document",
+        '{"name": "warren", "transactions": [{"rationale": "momentum [test]"}], '
+        '"portfolio_value_time_series": [["2025-01-01 10:00:00", 10000.0]], '
+        '"balance": 10000.0}',
+    ),
+    (
+        "brackets inside a series string (forces the fallback path)",
+        '{"name": "warren", "portfolio_value_time_series": '
+        '[["2025-01-01 [odd]", 10000.0]], "balance": 10000.0}',
+    ),
+    (
+        "unbalanced bracket inside a series string (partial regex match)",
+        '{"name": "warren", "portfolio_value_time_series": '
+        '[["2025-01-01 a]b", 10000.0], ["2025-01-02", 10100.0]], '
+        '"balance": 10000.0}',
+    ),
+]
+
+
+def main():
+    print("=" * 60)
+    print("Account Report - Time-Series Strip Test")
+    print("=" * 60)
+
+    failures = 0
+    for description, account in CASES:
+        expected = json.loads(account)
+        expected.pop("portfolio_value_time_series", None)
+
+        stripped = strip_time_series(account)
+        try:
+            actual = json.loads(stripped)
+        except json.JSONDecodeError as e:
+            print(f"✗ {description}: output is not valid JSON ({e})")
+            failures += 1
+            continue
+
+        if actual == expected:
+            print(f"✓ {description}")
+        else:
+            print(f"✗ {description}: got {actual}, expected {expected}")
+            failures += 1
+
+    print("\n" + "=" * 60)
+    if failures == 0:
+        print(f"✅ All {len(CASES)} strip cases passed")
+    else:
+        print(f"⚠ {failures}/{len(CASES)} strip cases failed")
+    print("=" * 60)
+
+    return failures == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -13,10 +13,18 @@ Tests:
 """
 
 import asyncio
+import os
 import sys
-from dotenv import load_dotenv
+from core.env_bootstrap import ensure_env
 
-load_dotenv(override=True)
+ensure_env()  # loads .env once per process and installs uvloop
+
+from tests._llm_cache import install_llm_cache
+
+install_llm_cache()  # replays cached LLM responses when LLM_CACHE=1
+
+from tests._output import buffered, task_buffered_stdout
+from tests._steps import test_step
 
 
 async def test_researcher_tool_creation():
@@ -24,10 +32,10 @@ async def test_researcher_tool_creation():
     print("\n=== Test 1: Researcher Tool Creation ===")
     
     try:
-        from agents.researcher import get_strands_researcher_tool
-        
-        researcher_tool = await get_strands_researcher_tool("TestTrader", "gpt-4o-mini")
-        
+        from agents.researcher_registry import get_shared_researcher_tool
+
+        researcher_tool = await get_shared_researcher_tool("TestTrader", "gpt-4o-mini")
+
         print(f"✓ Created researcher tool")
         print(f"  Type: {type(researcher_tool)}")
         print(f"  Name: {researcher_tool.name if hasattr(researcher_tool, 'name') else 'N/A'}")
@@ -44,111 +52,98 @@ async def test_researcher_tool_creation():
         return False, None
 
 
+@test_step("Tool invocation")
 async def test_tool_direct_invocation():
     """Test 2: Invoke the researcher tool directly"""
     print("\n=== Test 2: Direct Tool Invocation ===")
-    
-    try:
-        from agents.researcher import get_strands_researcher_tool
-        
-        researcher_tool = await get_strands_researcher_tool("TestTrader", "gpt-4o-mini")
-        
-        query = "What is Tesla's current stock price? Be very brief."
-        print(f"Query: {query}")
-        print("Invoking tool... (may take 30-60 seconds)")
-        
-        result = await researcher_tool(query)
-        
-        print(f"✓ Tool invoked successfully")
-        print(f"  Response type: {type(result)}")
-        print(f"  Response preview: {str(result)[:200]}...")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Tool invocation failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
 
+    from agents.researcher_registry import get_shared_researcher_tool
+
+    # Same (name, model) key as test 1, so this reuses the tool built
+    # there instead of bootstrapping the researcher MCP servers again
+    researcher_tool = await get_shared_researcher_tool("TestTrader", "gpt-4o-mini")
+
+    query = "What is Tesla's current stock price? Be very brief."
+    print(f"Query: {query}")
+    print("Invoking tool... (may take 30-60 seconds)")
+
+    result = await researcher_tool(query)
 
+    print(f"✓ Tool invoked successfully")
+    print(f"  Response type: {type(result)}")
+    print(f"  Response preview: {str(result)[:200]}...")
+
+    return True
+
+
+@test_step("Agent with tool")
 async def test_tool_with_agent():
     """Test 3: Use researcher tool with another agent"""
     print("\n=== Test 3: Tool Used by Another Agent ===")
-    
-    try:
-        from agents.researcher import get_strands_researcher_tool
-        from strands import Agent
-        from core.model_providers import ModelProvider
-        
-        researcher_tool = await get_strands_researcher_tool("TestTrader", "gpt-4o-mini")
-        
-        model = ModelProvider.get_strands_model("gpt-4o-mini")
-        test_agent = Agent(
-            name="TestAgent",
-            system_prompt="You are a test agent. You have access to a researcher tool. Use it to answer questions.",
-            model=model,
-            tools=[researcher_tool]
-        )
-        
-        print(f"✓ Created test agent with researcher tool")
-        
-        query = "Use the researcher to find out: What is happening with Tesla stock today? Give a brief summary."
-        print(f"\nQuery to agent: {query}")
-        print("Invoking agent... (may take 60-90 seconds)")
-        
-        result = await test_agent.invoke_async(query)
-        
-        print(f"✓ Agent responded successfully")
-        print(f"  Stop reason: {result.stop_reason}")
-        
-        if hasattr(result, 'message'):
-            msg = result.message
-            if isinstance(msg, dict) and 'content' in msg:
-                content = msg['content']
-                if isinstance(content, list) and len(content) > 0:
-                    first_content = content[0]
-                    if isinstance(first_content, dict) and 'text' in first_content:
-                        response_text = first_content['text'][:300]
-                        print(f"  Response preview: {response_text}...")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Agent with tool failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
 
+    from strands import Agent
+    from agents.researcher_registry import get_shared_researcher_tool
+    from core.model_providers import ModelProvider
+
+    researcher_tool = await get_shared_researcher_tool("TestTrader", "gpt-4o-mini")
+
+    model = ModelProvider.get_strands_model("gpt-4o-mini")
+    test_agent = Agent(
+        name="TestAgent",
+        system_prompt="You are a test agent. You have access to a researcher tool. Use it to answer questions.",
+        model=model,
+        tools=[researcher_tool]
+    )
+
+    print(f"✓ Created test agent with researcher tool")
 
+    query = "Use the researcher to find out: What is happening with Tesla stock today? Give a brief summary."
+    print(f"\nQuery to agent: {query}")
+    print("Invoking agent... (may take 60-90 seconds)")
+
+    result = await test_agent.invoke_async(query)
+
+    print(f"✓ Agent responded successfully")
+    print(f"  Stop reason: {result.stop_reason}")
+
+    if hasattr(result, 'message'):
+        msg = result.message
+        if isinstance(msg, dict) and 'content' in msg:
+            content = msg['content']
+            if isinstance(content, list) and len(content) > 0:
+                first_content = content[0]
+                if isinstance(first_content, dict) and 'text' in first_content:
+                    response_text = first_content['text'][:300]
+                    print(f"  Response preview: {response_text}...")
+
+    return True
+
+
+@test_step("OpenAI Agents tool creation")
 async def test_compare_with_openai_agents():
     """Test 4: Compare with OpenAI Agents pattern"""
     print("\n=== Test 4: Compare with OpenAI Agents Pattern ===")
-    
-    try:
-        from traders import get_researcher_tool
-        from agents.mcp import MCPServerStdio
-        from mcp_params import researcher_mcp_server_params
-        from contextlib import AsyncExitStack
-        
-        async with AsyncExitStack() as stack:
-            mcp_servers = [
-                await stack.enter_async_context(
-                    MCPServerStdio(params, client_session_timeout_seconds=120)
-                )
-                for params in researcher_mcp_server_params("TestTrader")
-            ]
-            
-            researcher_tool = await get_researcher_tool(mcp_servers, "gpt-4o-mini")
-            
-            print(f"✓ Created OpenAI Agents researcher tool")
-            print(f"  Type: {type(researcher_tool)}")
-            print(f"  Name: {researcher_tool.name if hasattr(researcher_tool, 'name') else 'N/A'}")
-            
-            return True
-    except Exception as e:
-        print(f"✗ OpenAI Agents tool creation failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+
+    from legacy.traders import get_researcher_tool as get_openai_researcher_tool
+    from agents.mcp import MCPServerStdio
+    from infrastructure.mcp_params import researcher_mcp_server_params
+    from contextlib import AsyncExitStack
+
+    async with AsyncExitStack() as stack:
+        mcp_servers = [
+            await stack.enter_async_context(
+                MCPServerStdio(params, client_session_timeout_seconds=120)
+            )
+            for params in researcher_mcp_server_params("TestTrader")
+        ]
+
+        researcher_tool = await get_openai_researcher_tool(mcp_servers, "gpt-4o-mini")
+
+        print(f"✓ Created OpenAI Agents researcher tool")
+        print(f"  Type: {type(researcher_tool)}")
+        print(f"  Name: {researcher_tool.name if hasattr(researcher_tool, 'name') else 'N/A'}")
+
+        return True
 
 
 async def main():
@@ -166,12 +161,35 @@ async def main():
         print("\n⚠ Cannot proceed without tool creation working")
         return False
     
+    # Tests 2-4 don't depend on each other (each builds its own tool/agent),
+    # so run them concurrently: wall time is the slowest of the three instead
+    # of their ~1-2 minutes each in sequence
     print("\n⚠ Note: The next tests involve actual API calls and may take 1-2 minutes")
-    results.append(await test_tool_direct_invocation())
-    
-    results.append(await test_tool_with_agent())
-    
-    results.append(await test_compare_with_openai_agents())
+    # TaskGroup gives structured concurrency: if one test task somehow
+    # raises past its own handler (e.g. a stalled MCP server cancelled at
+    # interpreter level), the siblings are cancelled instead of lingering.
+    # Prints are buffered per task and emitted in test order afterwards
+    # The legacy comparison costs a full MCP+LLM round trip but never
+    # gates the exit code, so default runs skip it; set RUN_COMPARE=1 to
+    # include it
+    run_compare = os.getenv("RUN_COMPARE", "").strip().lower() in ("1", "true")
+
+    with task_buffered_stdout():
+        async with asyncio.TaskGroup() as tg:
+            t2 = tg.create_task(buffered(test_tool_direct_invocation))
+            t3 = tg.create_task(buffered(test_tool_with_agent))
+            t4 = (
+                tg.create_task(buffered(test_compare_with_openai_agents))
+                if run_compare else None
+            )
+    outcomes = [t2.result(), t3.result()]
+    if t4 is not None:
+        outcomes.append(t4.result())
+    for result, output in outcomes:
+        sys.stdout.write(output)
+        results.append(result is True)
+    if t4 is None:
+        results.append(None)
     
     print("\n" + "=" * 60)
     print("Validation Summary")
@@ -185,13 +203,15 @@ async def main():
     ]
     
     for i, (name, result) in enumerate(zip(test_names, results), 1):
-        status = "✓ PASS" if result else "✗ FAIL"
+        if result is None:
+            status = "⚠ SKIPPED (set RUN_COMPARE=1)"
+        else:
+            status = "✓ PASS" if result else "✗ FAIL"
         importance = " 🔥" if i == 3 else ""
         print(f"Test {i}: {name:<35} {status}{importance}")
-    
-    passed = sum(results)
-    total = len(results)
-    print(f"\nTotal: {passed}/{total} tests passed")
+
+    counted = [result for result in results if result is not None]
+    print(f"\nTotal: {sum(counted)}/{len(counted)} tests passed")
     
     if results[2]:
         print("\n✅ Phase 3 validation SUCCESSFUL!")
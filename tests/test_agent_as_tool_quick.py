@@ -4,21 +4,29 @@ Quick test for Phase 3 - just tool creation without invocation
 
 import asyncio
 import sys
-from dotenv import load_dotenv
+from core.env_bootstrap import ensure_env
 
-load_dotenv(override=True)
+ensure_env()  # loads .env once per process and installs uvloop
+
+from tests._llm_cache import install_llm_cache
+
+install_llm_cache()  # replays cached LLM responses when LLM_CACHE=1
+
+# Heavy stack imported once at module scope rather than inside the test,
+# so the cost is paid at startup instead of under the import lock mid-run
+from strands import Agent
+from agents.researcher import get_researcher_tool
+from core.model_providers import ModelProvider
 
 
 async def test_quick():
     print("=" * 60)
     print("Phase 3 Quick Test - Tool Creation Only")
     print("=" * 60)
-    
+
     print("\nTest 1: Create Researcher Tool")
     try:
-        from agents.researcher import get_strands_researcher_tool
-        
-        researcher_tool = await get_strands_researcher_tool("TestTrader", "gpt-4o-mini")
+        researcher_tool = await get_researcher_tool("TestTrader", "gpt-4o-mini")
         
         print(f"✓ Created researcher tool")
         print(f"  Type: {type(researcher_tool)}")
@@ -29,9 +37,6 @@ async def test_quick():
             print(f"  ✓ Tool is callable")
         
         print("\nTest 2: Use Tool in Agent")
-        from strands import Agent
-        from core.model_providers import ModelProvider
-        
         model = ModelProvider.get_strands_model("gpt-4o-mini")
         agent = Agent(
             name="TestAgent",
@@ -10,63 +10,71 @@ This script validates that:
 
 import asyncio
 import sys
-from dotenv import load_dotenv
+from core.env_bootstrap import ensure_env
 import os
 
-load_dotenv(override=True)
+ensure_env()  # loads .env once per process and installs uvloop
 
+from tests._output import buffered, task_buffered_stdout
+
+# Models to test (based on what's configured in the trading floor)
+TEST_CASES = [
+    ("gpt-4o-mini", "OpenAI"),
+    ("deepseek-chat", "DeepSeek"),
+    ("gemini-2.5-flash-preview-04-17", "Gemini"),
+    ("grok-3-mini-beta", "Grok"),
+]
+
+
+async def _try_create(factory, model_name):
+    """Run one (sync) model factory off-thread, returning the error or None"""
+    try:
+        await asyncio.to_thread(factory, model_name)
+        return None
+    except Exception as e:
+        return e
+
+
+async def _create_all(factory, test_cases):
+    """
+    Create every model concurrently and print results in input order.
+
+    The factories are independent per provider, so the fan-out costs the
+    slowest creation rather than the sum; buffering the prints until the
+    gather resolves keeps the output readable.
+    """
+    errors = await asyncio.gather(
+        *(_try_create(factory, model_name) for model_name, _ in test_cases)
+    )
 
-async def test_strands_model_creation():
-    """Test 1: Create Strands models for different providers"""
-    print("\n=== Test 1: Strands Model Creation ===")
-    
-    from core.model_providers import ModelProvider
-    
-    # Models to test (based on what's configured in traders.py)
-    test_cases = [
-        ("gpt-4o-mini", "OpenAI"),
-        ("deepseek-chat", "DeepSeek"),
-        ("gemini-2.5-flash-preview-04-17", "Gemini"),
-        ("grok-3-mini-beta", "Grok"),
-    ]
-    
     results = []
-    for model_name, provider in test_cases:
-        try:
-            model = ModelProvider.get_strands_model(model_name)
+    for (model_name, provider), error in zip(test_cases, errors):
+        if error is None:
             print(f"✓ {provider}: Created model for {model_name}")
             results.append(True)
-        except Exception as e:
-            print(f"✗ {provider}: Failed to create {model_name}: {e}")
+        else:
+            print(f"✗ {provider}: Failed to create {model_name}: {error}")
             results.append(False)
-    
+
     return all(results)
 
 
+async def test_strands_model_creation():
+    """Test 1: Create Strands models for different providers"""
+    print("\n=== Test 1: Strands Model Creation ===")
+
+    from core.model_providers import ModelProvider
+
+    return await _create_all(ModelProvider.get_strands_model, TEST_CASES)
+
+
 async def test_openai_agents_model_creation():
     """Test 2: Create OpenAI Agents SDK models for different providers"""
     print("\n=== Test 2: OpenAI Agents Model Creation ===")
-    
+
     from core.model_providers import ModelProvider
-    
-    test_cases = [
-        ("gpt-4o-mini", "OpenAI"),
-        ("deepseek-chat", "DeepSeek"),
-        ("gemini-2.5-flash-preview-04-17", "Gemini"),
-        ("grok-3-mini-beta", "Grok"),
-    ]
-    
-    results = []
-    for model_name, provider in test_cases:
-        try:
-            model = ModelProvider.get_openai_agents_model(model_name)
-            print(f"✓ {provider}: Created model for {model_name}")
-            results.append(True)
-        except Exception as e:
-            print(f"✗ {provider}: Failed to create {model_name}: {e}")
-            results.append(False)
-    
-    return all(results)
+
+    return await _create_all(ModelProvider.get_openai_agents_model, TEST_CASES)
 
 
 async def test_strands_agent_with_model():
@@ -146,10 +154,17 @@ async def test_model_switching():
     ]
     
     try:
+        # The switches are independent lookups (the provider memoizes per
+        # model_name), so issue them concurrently and print in order
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(ModelProvider.get_strands_model, model_name)
+                for model_name in model_sequence
+            )
+        )
         for model_name in model_sequence:
-            model = ModelProvider.get_strands_model(model_name)
             print(f"✓ Switched to {model_name}")
-        
+
         print(f"✓ Model switching works correctly")
         return True
     except Exception as e:
@@ -189,11 +204,17 @@ async def main():
     # Test 2: OpenAI Agents model creation
     results.append(await test_openai_agents_model_creation())
     
-    # Test 3: Strands agent with model provider
-    results.append(await test_strands_agent_with_model())
-    
-    # Test 4: OpenAI Agents agent with model provider
-    results.append(await test_openai_agents_agent_with_model())
+    # Tests 3 and 4: agent integration for both SDKs. The two tests are
+    # independent (and both get the same memoized gpt-4o-mini model from
+    # the provider cache), so run them concurrently — the wall-clock cost
+    # is the strands invocation rather than the sum of both tests
+    with task_buffered_stdout():
+        async with asyncio.TaskGroup() as tg:
+            t3 = tg.create_task(buffered(test_strands_agent_with_model))
+            t4 = tg.create_task(buffered(test_openai_agents_agent_with_model))
+    for result, output in (t3.result(), t4.result()):
+        sys.stdout.write(output)
+        results.append(result)
     
     # Test 5: Model switching
     results.append(await test_model_switching())
@@ -9,90 +9,79 @@ Tests:
 2. Both can handle the same research queries
 3. MCP tools are accessible in both
 4. Response quality is comparable
+
+Each researcher (and its MCP servers) is created once in main() and
+shared by every test that needs it, so the stdio subprocess spawns and
+MCP handshakes are paid once instead of once per test.
 """
 
 import asyncio
+import os
 import sys
+import traceback
 from contextlib import AsyncExitStack
-from dotenv import load_dotenv
+from core.env_bootstrap import ensure_env
+
+ensure_env()
+
+from tests._llm_cache import install_llm_cache
 
-load_dotenv(override=True)
+install_llm_cache()  # replays cached LLM responses when LLM_CACHE=1
 
+# Strands stack imported once at module scope; the legacy OpenAI Agents
+# imports stay inside main()'s try block since that SDK is optional
+from agents.researcher import get_researcher as get_strands_researcher
 
-async def test_strands_researcher_creation():
-    """Test 1: Create Strands Researcher agent"""
+
+async def test_strands_researcher_creation(researcher):
+    """Test 1: Strands Researcher agent was created"""
     print("\n=== Test 1: Strands Researcher Creation ===")
-    
-    try:
-        from agents.researcher import get_strands_researcher
-        
-        researcher = await get_strands_researcher("TestTrader", "gpt-4o-mini")
-        print(f"✓ Created Strands researcher: {researcher.name}")
-        
-        # Check if agent has tools
-        if hasattr(researcher, '_tools') or hasattr(researcher, 'tools'):
-            print(f"  ✓ Agent has tools configured")
-        
-        # Cleanup
-        if hasattr(researcher, 'cleanup') and callable(researcher.cleanup):
-            await researcher.cleanup()
-        
-        return True
-    except Exception as e:
-        print(f"✗ Failed to create Strands researcher: {e}")
-        import traceback
-        traceback.print_exc()
+
+    if researcher is None:
+        print("✗ Strands researcher was not created")
         return False
 
+    print(f"✓ Created Strands researcher: {researcher.name}")
+
+    # Check if agent has tools
+    if hasattr(researcher, '_tools') or hasattr(researcher, 'tools'):
+        print(f"  ✓ Agent has tools configured")
 
-async def test_openai_agents_researcher_creation():
-    """Test 2: Create OpenAI Agents Researcher agent"""
+    return True
+
+
+async def test_openai_agents_researcher_creation(researcher):
+    """Test 2: OpenAI Agents Researcher agent was created"""
     print("\n=== Test 2: OpenAI Agents Researcher Creation ===")
-    
-    try:
-        from traders import get_researcher
-        from agents.mcp import MCPServerStdio
-        from mcp_params import researcher_mcp_server_params
-        
-        # Create MCP servers
-        async with AsyncExitStack() as stack:
-            mcp_servers = [
-                await stack.enter_async_context(
-                    MCPServerStdio(params, client_session_timeout_seconds=120)
-                )
-                for params in researcher_mcp_server_params("TestTrader")
-            ]
-            
-            researcher = await get_researcher(mcp_servers, "gpt-4o-mini")
-            print(f"✓ Created OpenAI Agents researcher: {researcher.name}")
-            return True
-    except Exception as e:
-        print(f"✗ Failed to create OpenAI Agents researcher: {e}")
-        import traceback
-        traceback.print_exc()
+
+    if researcher is None:
+        print("✗ OpenAI Agents researcher was not created")
         return False
 
+    print(f"✓ Created OpenAI Agents researcher: {researcher.name}")
+    return True
 
-async def test_strands_researcher_invocation():
+
+async def test_strands_researcher_invocation(researcher):
     """Test 3: Invoke Strands Researcher with simple query"""
     print("\n=== Test 3: Strands Researcher Invocation ===")
-    
+
+    if researcher is None:
+        print("⚠ Skipping invocation test (no Strands researcher)")
+        return False
+
     try:
-        from agents.researcher import get_strands_researcher
-        
-        researcher = await get_strands_researcher("TestTrader", "gpt-4o-mini")
-        
         # Simple query that should work quickly
         query = "What is the current stock market sentiment? Keep your answer brief."
-        
+
         print(f"Query: {query}")
         print("Invoking researcher... (this may take 30-60 seconds)")
-        
+
         result = await researcher.invoke_async(query)
-        
+
         print(f"✓ Researcher responded successfully")
         print(f"  Stop reason: {result.stop_reason}")
-        
+
         # Try to extract response text
         if hasattr(result, 'message'):
             msg = result.message
@@ -101,105 +90,121 @@ async def test_strands_researcher_invocation():
                 if isinstance(content, list) and len(content) > 0:
                     response_text = content[0].get('text', '')[:200]
                     print(f"  Response preview: {response_text}...")
-        
-        # Cleanup
-        if hasattr(researcher, 'cleanup') and callable(researcher.cleanup):
-            await researcher.cleanup()
-        
+
         return True
     except Exception as e:
         print(f"✗ Strands researcher invocation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.getenv("STRANDS_DEBUG"):
+            traceback.print_exc()
         return False
 
 
-async def test_openai_agents_researcher_invocation():
+async def test_openai_agents_researcher_invocation(researcher):
     """Test 4: Invoke OpenAI Agents Researcher with simple query"""
     print("\n=== Test 4: OpenAI Agents Researcher Invocation ===")
-    
+
+    if researcher is None:
+        print("⚠ Skipping invocation test (no OpenAI Agents researcher)")
+        return False
+
     try:
-        from traders import get_researcher
         from agents import Runner
-        from agents.mcp import MCPServerStdio
-        from mcp_params import researcher_mcp_server_params
-        
-        # Create MCP servers
-        async with AsyncExitStack() as stack:
-            mcp_servers = [
-                await stack.enter_async_context(
-                    MCPServerStdio(params, client_session_timeout_seconds=120)
-                )
-                for params in researcher_mcp_server_params("TestTrader")
-            ]
-            
-            researcher = await get_researcher(mcp_servers, "gpt-4o-mini")
-            
-            # Simple query
-            query = "What is the current stock market sentiment? Keep your answer brief."
-            
-            print(f"Query: {query}")
-            print("Invoking researcher... (this may take 30-60 seconds)")
-            
-            await Runner.run(researcher, query, max_turns=10)
-            
-            print(f"✓ OpenAI Agents researcher responded successfully")
-            
-            return True
+
+        # Simple query
+        query = "What is the current stock market sentiment? Keep your answer brief."
+
+        print(f"Query: {query}")
+        print("Invoking researcher... (this may take 30-60 seconds)")
+
+        await Runner.run(researcher, query, max_turns=10)
+
+        print(f"✓ OpenAI Agents researcher responded successfully")
+
+        return True
     except Exception as e:
         print(f"✗ OpenAI Agents researcher invocation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.getenv("STRANDS_DEBUG"):
+            traceback.print_exc()
         return False
 
 
-async def test_mcp_tool_availability():
+async def test_mcp_tool_availability(researcher):
     """Test 5: Verify MCP tools are available"""
     print("\n=== Test 5: MCP Tool Availability ===")
-    
-    try:
-        from agents.researcher import get_strands_researcher
-        
-        researcher = await get_strands_researcher("TestTrader", "gpt-4o-mini")
-        
-        # Check if MCP tools are loaded
-        # This is implementation-specific, so we just verify no errors
-        print("✓ Strands researcher created with MCP configuration")
-        print("  Expected tools: brave_web_search, fetch, memory operations")
-        
-        # Cleanup
-        if hasattr(researcher, 'cleanup') and callable(researcher.cleanup):
-            await researcher.cleanup()
-        
-        return True
-    except Exception as e:
-        print(f"✗ MCP tool check failed: {e}")
+
+    if researcher is None:
+        print("✗ MCP tool check failed (no Strands researcher)")
         return False
 
+    # Check if MCP tools are loaded
+    # This is implementation-specific, so we just verify no errors
+    print("✓ Strands researcher created with MCP configuration")
+    print("  Expected tools: brave_web_search, fetch, memory operations")
+
+    return True
+
 
 async def main():
     """Run all validation tests"""
     print("=" * 60)
     print("Researcher Migration - Phase 2 Validation")
     print("=" * 60)
-    
-    results = []
-    
-    results.append(await test_strands_researcher_creation())
-    
-    results.append(await test_openai_agents_researcher_creation())
-    
-    print("\n⚠ Note: Invocation tests may take 30-60 seconds each")
-    results.append(await test_strands_researcher_invocation())
-    
-    results.append(await test_openai_agents_researcher_invocation())
-    
-    results.append(await test_mcp_tool_availability())
-    
+
+    # Shared fixtures: create each researcher once, up front
+    strands_researcher = None
+    try:
+        strands_researcher = await get_strands_researcher("TestTrader", "gpt-4o-mini")
+    except Exception as e:
+        print(f"\n✗ Failed to create Strands researcher: {e}")
+        if os.getenv("STRANDS_DEBUG"):
+            traceback.print_exc()
+
+    async with AsyncExitStack() as stack:
+        openai_researcher = None
+        try:
+            from legacy.traders import get_researcher as get_openai_researcher
+            from agents.mcp import MCPServerStdio
+            from infrastructure.mcp_params import researcher_mcp_server_params
+
+            mcp_servers = [
+                await stack.enter_async_context(
+                    MCPServerStdio(params, client_session_timeout_seconds=120)
+                )
+                for params in researcher_mcp_server_params("TestTrader")
+            ]
+            openai_researcher = await get_openai_researcher(mcp_servers, "gpt-4o-mini")
+        except Exception as e:
+            print(f"\n✗ Failed to create OpenAI Agents researcher: {e}")
+            if os.getenv("STRANDS_DEBUG"):
+                traceback.print_exc()
+
+        results = []
+
+        # The two SDKs are independent, so run each creation/invocation
+        # pair concurrently; wall time becomes the slower of the two
+        # instead of their sum (the invocations run 30-60s each)
+        async with asyncio.TaskGroup() as tg:
+            t1 = tg.create_task(test_strands_researcher_creation(strands_researcher))
+            t2 = tg.create_task(test_openai_agents_researcher_creation(openai_researcher))
+        results.extend([t1.result(), t2.result()])
+
+        print("\n⚠ Note: Invocation tests may take 30-60 seconds each")
+        async with asyncio.TaskGroup() as tg:
+            t3 = tg.create_task(test_strands_researcher_invocation(strands_researcher))
+            t4 = tg.create_task(test_openai_agents_researcher_invocation(openai_researcher))
+        results.extend([t3.result(), t4.result()])
+
+        results.append(await test_mcp_tool_availability(strands_researcher))
+
+    # Cleanup the shared Strands researcher once, after all tests
+    if strands_researcher is not None:
+        if hasattr(strands_researcher, 'cleanup') and callable(strands_researcher.cleanup):
+            await strands_researcher.cleanup()
+
     print("\n" + "=" * 60)
     print("Validation Summary")
     print("=" * 60)
-    
+
     test_names = [
         "Strands Researcher Creation",
         "OpenAI Agents Researcher Creation",
@@ -207,15 +212,15 @@ async def main():
         "OpenAI Agents Invocation",
         "MCP Tool Availability",
     ]
-    
+
     for i, (name, result) in enumerate(zip(test_names, results), 1):
         status = "✓ PASS" if result else "✗ FAIL"
         print(f"Test {i}: {name:<35} {status}")
-    
+
     passed = sum(results)
     total = len(results)
     print(f"\nTotal: {passed}/{total} tests passed")
-    
+
     if all(results):
         print("\n✅ Phase 2 validation SUCCESSFUL!")
         print("Researcher agent migration complete!")
@@ -236,6 +241,5 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"\n\nUnexpected error during validation: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
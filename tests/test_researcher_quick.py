@@ -6,21 +6,32 @@ This runs only the fast tests to validate basic functionality.
 
 import asyncio
 import sys
-from dotenv import load_dotenv
+from core.env_bootstrap import ensure_env
 
-load_dotenv(override=True)
+ensure_env()  # loads .env once per process and installs uvloop
+
+from tests._llm_cache import install_llm_cache
+
+install_llm_cache()  # replays cached LLM responses when LLM_CACHE=1
+
+# Strands stack imported once at module scope rather than inside the test;
+# the legacy OpenAI Agents imports stay inside their try block below since
+# that SDK is optional and its absence should fail the test, not the script
+from contextlib import AsyncExitStack
+
+from agents.researcher import get_researcher
+from infrastructure.mcp_params import researcher_mcp_server_params
 
 
 async def test_both_researchers_creation():
     """Test both Strands and OpenAI Agents researchers can be created"""
     print("\n=== Testing Both Researcher Implementations ===\n")
-    
+
     results = []
-    
+
     print("1. Strands Researcher:")
     try:
-        from agents.researcher import get_strands_researcher
-        researcher = await get_strands_researcher("TestTrader", "gpt-4o-mini")
+        researcher = await get_researcher("TestTrader", "gpt-4o-mini")
         print(f"   ✓ Created: {researcher.name}")
         results.append(True)
     except Exception as e:
@@ -29,11 +40,9 @@ async def test_both_researchers_creation():
     
     print("\n2. OpenAI Agents Researcher:")
     try:
-        from traders import get_researcher
+        from legacy.traders import get_researcher as get_openai_researcher
         from agents.mcp import MCPServerStdio
-        from mcp_params import researcher_mcp_server_params
-        from contextlib import AsyncExitStack
-        
+
         async with AsyncExitStack() as stack:
             mcp_servers = [
                 await stack.enter_async_context(
@@ -41,8 +50,8 @@ async def test_both_researchers_creation():
                 )
                 for params in researcher_mcp_server_params("TestTrader")
             ]
-            
-            researcher = await get_researcher(mcp_servers, "gpt-4o-mini")
+
+            researcher = await get_openai_researcher(mcp_servers, "gpt-4o-mini")
             print(f"   ✓ Created: {researcher.name}")
             results.append(True)
     except Exception as e:
@@ -5,21 +5,28 @@ Tests that the researcher tool can be invoked directly
 
 import asyncio
 import sys
-from dotenv import load_dotenv
+import traceback
+from core.env_bootstrap import ensure_env
 
-load_dotenv(override=True)
+ensure_env()  # loads .env once per process and installs uvloop
+
+from tests._llm_cache import install_llm_cache
+
+install_llm_cache()  # replays cached LLM responses when LLM_CACHE=1
+
+# Heavy stack imported once at module scope rather than inside the test,
+# so the cost is paid at startup instead of under the import lock mid-run
+from agents.researcher import get_researcher_tool
 
 
 async def main():
     print("=" * 60)
     print("Phase 3 - Direct Tool Invocation Test")
     print("=" * 60)
-    
+
     try:
-        from agents.researcher import get_strands_researcher_tool
-        
         print("\n1. Creating researcher tool...")
-        researcher_tool = await get_strands_researcher_tool("TestTrader", "gpt-4o-mini")
+        researcher_tool = await get_researcher_tool("TestTrader", "gpt-4o-mini")
         print("   ✓ Tool created")
         
         print("\n2. Invoking tool directly...")
@@ -40,7 +47,6 @@ async def main():
         
     except Exception as e:
         print(f"\n✗ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
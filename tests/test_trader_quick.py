@@ -6,9 +6,20 @@ This tests trader creation and setup without running a full trading cycle.
 
 import asyncio
 import sys
-from dotenv import load_dotenv
+import traceback
+from core.env_bootstrap import ensure_env
 
-load_dotenv(override=True)
+ensure_env()  # loads .env once per process and installs uvloop
+
+from tests._llm_cache import install_llm_cache
+
+install_llm_cache()  # replays cached LLM responses when LLM_CACHE=1
+
+# Heavy stack imported once at module scope rather than inside the test,
+# so the cost is paid at startup instead of under the import lock mid-run
+from agents.trader import Trader
+from agents.researcher import get_researcher_tool
+from infrastructure.mcp_pool import get_pooled_clients
 
 
 async def test_trader_creation():
@@ -16,12 +27,10 @@ async def test_trader_creation():
     print("=" * 60)
     print("Phase 4 Quick Test - Trader Creation")
     print("=" * 60)
-    
+
     try:
-        from agents.trader import StrandsTrader
-        
-        print("\n1. Creating StrandsTrader instance...")
-        trader = StrandsTrader("Warren", "Patience", "gpt-4o-mini")
+        print("\n1. Creating Trader instance...")
+        trader = Trader("Warren", "Patience", "gpt-4o-mini")
         
         print(f"✓ Trader created")
         print(f"  Name: {trader.name}")
@@ -35,33 +44,12 @@ async def test_trader_creation():
         print(f"  Preview: {account[:100]}...")
         
         print("\n3. Creating researcher tool...")
-        from agents.researcher import get_strands_researcher_tool
-        researcher_tool = await get_strands_researcher_tool(trader.name, trader.model_name)
+        researcher_tool = await get_researcher_tool(trader.name, trader.model_name)
         print(f"✓ Researcher tool created")
-        
-        print("\n4. Creating trader MCP clients...")
-        from mcp.client.stdio import StdioServerParameters, stdio_client
-        from strands.tools.mcp import MCPClient
-        from mcp_params import trader_mcp_server_params
-        
-        trader_mcp_tools = []
-        for params in trader_mcp_server_params:
-            server_params = StdioServerParameters(
-                command=params["command"],
-                args=params["args"],
-                env=params.get("env")
-            )
-            
-            def make_transport(sp=server_params):
-                return stdio_client(sp)
-            
-            mcp_client = MCPClient(
-                transport_callable=make_transport,
-                startup_timeout=120
-            )
-            trader_mcp_tools.append(mcp_client)
-        
-        print(f"✓ Created {len(trader_mcp_tools)} trader MCP clients")
+
+        print("\n4. Fetching pooled trader MCP clients...")
+        trader_mcp_tools = await get_pooled_clients()
+        print(f"✓ Got {len(trader_mcp_tools)} pooled trader MCP clients")
         
         print("\n5. Creating trader agent...")
         agent = await trader.create_agent(trader_mcp_tools, researcher_tool)
@@ -76,7 +64,6 @@ async def test_trader_creation():
         
     except Exception as e:
         print(f"\n✗ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -10,10 +10,11 @@ This script validates that:
 
 import asyncio
 import sys
-from dotenv import load_dotenv
 import os
+import traceback
+from core.env_bootstrap import ensure_env
 
-load_dotenv(override=True)
+ensure_env()
 
 
 async def test_strands_import():
@@ -64,8 +65,8 @@ async def test_basic_agent_creation():
         return True, agent
     except Exception as e:
         print(f"✗ Failed to create agent: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.getenv("STRANDS_DEBUG"):
+            traceback.print_exc()
         return False, None
 
 
@@ -102,8 +103,8 @@ async def test_agent_invocation(agent):
         return True
     except Exception as e:
         print(f"✗ Failed to invoke agent: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.getenv("STRANDS_DEBUG"):
+            traceback.print_exc()
         return False
 
 
@@ -146,31 +147,31 @@ async def main():
     print("Strands Agents SDK - Phase 0 Validation")
     print("=" * 60)
     
-    results = []
-    
-    # Test 1: Import
-    results.append(await test_strands_import())
-    if not results[-1]:
+    # Tests 1, 4 and 5 are independent import probes, so run them together;
+    # only creation (2) and invocation (3) have an ordering dependency
+    import_ok, mcp_ok, providers_ok = await asyncio.gather(
+        test_strands_import(),
+        test_mcp_import(),
+        test_model_providers()
+    )
+
+    if not import_ok:
         print("\n❌ Cannot proceed without Strands SDK installed")
         return False
-    
+
     # Test 2: Agent creation
     success, agent = await test_basic_agent_creation()
-    results.append(success)
-    
+
     # Test 3: Agent invocation (only if agent created successfully)
     if success:
-        results.append(await test_agent_invocation(agent))
+        invocation_ok = await test_agent_invocation(agent)
     else:
         print("\n⚠ Skipping invocation test (agent creation failed)")
-        results.append(False)
-    
-    # Test 4: MCP imports
-    results.append(await test_mcp_import())
-    
-    # Test 5: Model providers
-    results.append(await test_model_providers())
-    
+        invocation_ok = False
+
+    # Keep the summary in the original test order
+    results = [import_ok, success, invocation_ok, mcp_ok, providers_ok]
+
     # Summary
     print("\n" + "=" * 60)
     print("Validation Summary")
@@ -215,6 +216,5 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"\n\n❌ Unexpected error during validation: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)